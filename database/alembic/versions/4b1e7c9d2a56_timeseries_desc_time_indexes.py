@@ -0,0 +1,54 @@
+"""Newest-first (timestamp DESC) timeseries_data indexes
+
+Revision ID: 4b1e7c9d2a56
+Revises: 62ca30301e3a
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1e7c9d2a56'
+down_revision: Union[str, Sequence[str], None] = '62ca30301e3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_time_indexes(timestamp):
+    op.create_index(
+        'idx_timeseries_source_time',
+        'timeseries_data',
+        ['source_id', timestamp],
+        unique=False,
+        postgresql_using='btree'
+    )
+    op.create_index(
+        'idx_timeseries_scan_covering',
+        'timeseries_data',
+        ['source_id', timestamp],
+        unique=False,
+        postgresql_include=['close', 'value', 'quality_score']
+    )
+
+
+def _drop_time_indexes():
+    op.drop_index('idx_timeseries_scan_covering', table_name='timeseries_data')
+    op.drop_index('idx_timeseries_source_time', table_name='timeseries_data')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PRIMARY KEY constraints cannot declare a sort order, so the PK stays
+    # (source_id, timestamp) and the secondary indexes carry the DESC order
+    _drop_time_indexes()
+    _create_time_indexes(sa.text('timestamp DESC'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_time_indexes()
+    _create_time_indexes('timestamp')
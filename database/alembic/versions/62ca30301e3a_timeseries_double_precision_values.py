@@ -0,0 +1,89 @@
+"""Store timeseries OHLCV/value columns as DOUBLE PRECISION
+
+Revision ID: 62ca30301e3a
+Revises: 6de0d310f429
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '62ca30301e3a'
+down_revision: Union[str, Sequence[str], None] = '6de0d310f429'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VALUE_COLUMNS = ['open', 'high', 'low', 'close', 'volume', 'value']
+
+# ts_daily_agg (revision 8fa7b9ef7a28) depends on close/value, so it has to be
+# dropped before the column types change and rebuilt afterwards
+TS_DAILY_AGG_SQL = """
+    CREATE MATERIALIZED VIEW IF NOT EXISTS ts_daily_agg
+    WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+    SELECT
+        source_id,
+        time_bucket('1 day', timestamp) AS bucket,
+        MIN(close) AS min_close,
+        MAX(close) AS max_close,
+        SUM(close) AS sum_close,
+        COUNT(close) AS count_close,
+        MIN(value) AS min_value,
+        MAX(value) AS max_value,
+        SUM(value) AS sum_value,
+        COUNT(value) AS count_value
+    FROM timeseries_data
+    GROUP BY source_id, bucket
+    WITH NO DATA
+"""
+
+TS_DAILY_AGG_POLICY_SQL = """
+    SELECT add_continuous_aggregate_policy(
+        'ts_daily_agg',
+        start_offset => INTERVAL '7 days',
+        end_offset => INTERVAL '1 hour',
+        schedule_interval => INTERVAL '1 hour',
+        if_not_exists => TRUE
+    )
+"""
+
+
+def _alter_value_columns(type_, using):
+    for column in VALUE_COLUMNS:
+        op.alter_column(
+            'timeseries_data',
+            column,
+            type_=type_,
+            existing_nullable=True,
+            postgresql_using=f'{column}::{using}'
+        )
+
+
+def _rebuild_ts_daily_agg(alter):
+    with op.get_context().autocommit_block():
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS ts_daily_agg")
+
+    alter()
+
+    with op.get_context().autocommit_block():
+        op.execute(TS_DAILY_AGG_SQL)
+        op.execute(TS_DAILY_AGG_POLICY_SQL)
+        op.execute("CALL refresh_continuous_aggregate('ts_daily_agg', NULL, NULL)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_ts_daily_agg(
+        lambda: _alter_value_columns(postgresql.DOUBLE_PRECISION(), 'double precision')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_ts_daily_agg(
+        lambda: _alter_value_columns(sa.Numeric(precision=24, scale=8), 'numeric(24,8)')
+    )
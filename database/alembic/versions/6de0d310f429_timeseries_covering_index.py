@@ -0,0 +1,39 @@
+"""Covering index on timeseries_data for index-only range scans
+
+Revision ID: 6de0d310f429
+Revises: 8fa7b9ef7a28
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6de0d310f429'
+down_revision: Union[str, Sequence[str], None] = '8fa7b9ef7a28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'idx_timeseries_scan_covering',
+        'timeseries_data',
+        ['source_id', 'timestamp'],
+        unique=False,
+        postgresql_include=['close', 'value', 'quality_score']
+    )
+
+    # Index-only scans skip the heap only for pages marked all-visible,
+    # so populate the visibility map (VACUUM cannot run in a transaction)
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM (ANALYZE) timeseries_data")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_timeseries_scan_covering', table_name='timeseries_data')
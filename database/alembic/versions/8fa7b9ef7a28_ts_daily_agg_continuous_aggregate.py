@@ -0,0 +1,63 @@
+"""ts_daily_agg continuous aggregate for per-source statistics
+
+Revision ID: 8fa7b9ef7a28
+Revises: da8ccbf30b8a
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8fa7b9ef7a28'
+down_revision: Union[str, Sequence[str], None] = 'da8ccbf30b8a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Continuous aggregates cannot be created or refreshed inside a transaction
+    with op.get_context().autocommit_block():
+        # Sums + counts (not averages) so whole-history averages can be
+        # re-aggregated exactly from the daily buckets
+        op.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS ts_daily_agg
+            WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+            SELECT
+                source_id,
+                time_bucket('1 day', timestamp) AS bucket,
+                MIN(close) AS min_close,
+                MAX(close) AS max_close,
+                SUM(close) AS sum_close,
+                COUNT(close) AS count_close,
+                MIN(value) AS min_value,
+                MAX(value) AS max_value,
+                SUM(value) AS sum_value,
+                COUNT(value) AS count_value
+            FROM timeseries_data
+            GROUP BY source_id, bucket
+            WITH NO DATA
+        """)
+
+        op.execute("""
+            SELECT add_continuous_aggregate_policy(
+                'ts_daily_agg',
+                start_offset => INTERVAL '7 days',
+                end_offset => INTERVAL '1 hour',
+                schedule_interval => INTERVAL '1 hour',
+                if_not_exists => TRUE
+            )
+        """)
+
+        # Materialize existing history once; the policy keeps it current
+        op.execute("CALL refresh_continuous_aggregate('ts_daily_agg', NULL, NULL)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS ts_daily_agg")
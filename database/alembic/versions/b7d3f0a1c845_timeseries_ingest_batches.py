@@ -0,0 +1,61 @@
+"""Replace per-row timeseries_data audit timestamps with ingest batch ids
+
+Revision ID: b7d3f0a1c845
+Revises: 4b1e7c9d2a56
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3f0a1c845'
+down_revision: Union[str, Sequence[str], None] = '4b1e7c9d2a56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AUDIT_COLUMNS = ['created_at', 'updated_at', 'ingestion_timestamp']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ingest_batches',
+    sa.Column('batch_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=True),
+    sa.Column('started_at', postgresql.TIMESTAMP(), server_default=sa.func.now(), nullable=False),
+    sa.Column('completed_at', postgresql.TIMESTAMP(), nullable=True),
+    sa.Column('row_count', sa.Integer(), nullable=True),
+    sa.Column('ingested_by', sa.String(length=100), server_default='system', nullable=False),
+    sa.ForeignKeyConstraint(['source_id'], ['sources.source_id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('batch_id')
+    )
+    op.create_index(op.f('ix_ingest_batches_source_id'), 'ingest_batches', ['source_id'], unique=False)
+
+    op.add_column('timeseries_data', sa.Column('ingested_batch_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_timeseries_ingested_batch', 'timeseries_data', 'ingest_batches',
+        ['ingested_batch_id'], ['batch_id'], ondelete='SET NULL'
+    )
+
+    # 24 bytes per row of audit timestamps; existing rows keep no batch (NULL)
+    for column in AUDIT_COLUMNS:
+        op.drop_column('timeseries_data', column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in AUDIT_COLUMNS:
+        op.add_column(
+            'timeseries_data',
+            sa.Column(column, postgresql.TIMESTAMP(), server_default=sa.func.now(), nullable=False)
+        )
+
+    op.drop_constraint('fk_timeseries_ingested_batch', 'timeseries_data', type_='foreignkey')
+    op.drop_column('timeseries_data', 'ingested_batch_id')
+
+    op.drop_index(op.f('ix_ingest_batches_source_id'), table_name='ingest_batches')
+    op.drop_table('ingest_batches')
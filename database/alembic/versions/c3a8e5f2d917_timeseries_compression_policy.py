@@ -0,0 +1,52 @@
+"""Native compression for timeseries_data chunks older than 30 days
+
+Revision ID: c3a8e5f2d917
+Revises: b7d3f0a1c845
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8e5f2d917'
+down_revision: Union[str, Sequence[str], None] = 'b7d3f0a1c845'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPRESS_AFTER = "INTERVAL '30 days'"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Segment per source, newest first within a segment (matches the DESC indexes)
+    op.execute("""
+        ALTER TABLE timeseries_data SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'source_id',
+            timescaledb.compress_orderby = 'timestamp DESC'
+        )
+    """)
+
+    op.execute(f"SELECT add_compression_policy('timeseries_data', {COMPRESS_AFTER}, if_not_exists => TRUE)")
+
+    # Compress existing history once; the policy handles chunks as they age
+    op.execute(f"""
+        SELECT compress_chunk(chunk, if_not_compressed => TRUE)
+        FROM show_chunks('timeseries_data', older_than => {COMPRESS_AFTER}) AS chunk
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("SELECT remove_compression_policy('timeseries_data', if_exists => TRUE)")
+
+    op.execute("""
+        SELECT decompress_chunk(chunk, if_compressed => TRUE)
+        FROM show_chunks('timeseries_data') AS chunk
+    """)
+
+    op.execute("ALTER TABLE timeseries_data SET (timescaledb.compress = false)")
@@ -0,0 +1,55 @@
+"""Features hypertable with chunk-local unique index
+
+Revision ID: da8ccbf30b8a
+Revises: 8353946bb7d5
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da8ccbf30b8a'
+down_revision: Union[str, Sequence[str], None] = '8353946bb7d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Hypertables require every unique index to include the partition column,
+    # so the surrogate key becomes (feature_id, timestamp)
+    op.drop_constraint('uq_features_source_timestamp', 'features', type_='unique')
+    op.drop_constraint('features_pkey', 'features', type_='primary')
+    op.create_primary_key('features_pkey', 'features', ['feature_id', 'timestamp'])
+
+    # ix_features_timestamp already covers the time dimension
+    op.execute("""
+        SELECT create_hypertable(
+            'features',
+            'timestamp',
+            chunk_time_interval => INTERVAL '7 days',
+            create_default_indexes => FALSE,
+            if_not_exists => TRUE,
+            migrate_data => TRUE
+        )
+    """)
+
+    # Unique index on a hypertable is created per chunk, so ingest only
+    # maintains the index of the chunk being written
+    op.create_index('uq_features_source_timestamp', 'features', ['source_id', 'timestamp'], unique=True)
+
+    # Same columns as the unique index above
+    op.drop_index('idx_features_source_time', table_name='features')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # TimescaleDB cannot convert a hypertable back to a plain table in place;
+    # only the index layout is restored here
+    op.create_index('idx_features_source_time', 'features', ['source_id', 'timestamp'], unique=False)
+    op.drop_index('uq_features_source_timestamp', table_name='features')
+    op.create_unique_constraint('uq_features_source_timestamp', 'features', ['source_id', 'timestamp'])
@@ -4,7 +4,8 @@ Maps to PostgreSQL/TimescaleDB schema
 """
 
 from .base import Base, engine, SessionLocal, get_db, bulk_upsert
-from .core import Source, TimeseriesData, TimeIndex, MarketCalendar
+from .binary_copy import copy_to_arrays
+from .core import Source, TimeseriesData, TimeIndex, MarketCalendar, IngestBatch
 from .quality import ValidationRule, Anomaly, AuditLog, TimeseriesArchive
 from .analytics import Lineage, Feature, Forecast, BacktestResult, BacktestTrade, MLModel
 
@@ -14,10 +15,12 @@ __all__ = [
     'SessionLocal',
     'get_db',
     'bulk_upsert',
+    'copy_to_arrays',
     'Source',
     'TimeseriesData',
     'TimeIndex',
     'MarketCalendar',
+    'IngestBatch',
     'ValidationRule',
     'Anomaly',
     'AuditLog',
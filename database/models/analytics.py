@@ -13,7 +13,7 @@ from sqlalchemy.orm import relationship, column_property
 from sqlalchemy.sql import func, select
 from sqlalchemy.ext.hybrid import hybrid_property
 
-from .base import Base
+from .base import Base, float_or_none
 
 
 # ============================================================================
@@ -62,12 +62,16 @@ class Lineage(Base):
 # ============================================================================
 
 class Feature(Base):
-    """Pre-computed ML features for fast model training"""
+    """
+    Pre-computed ML features for fast model training
+    This is a TimescaleDB hypertable (7-day chunks), so the time column is part
+    of the primary key and the (source_id, timestamp) unique index is chunk-local
+    """
     __tablename__ = 'features'
 
     feature_id = Column(BigInteger, primary_key=True, autoincrement=True)
     source_id = Column(Integer, ForeignKey('sources.source_id', ondelete='CASCADE'), nullable=False, index=True)
-    timestamp = Column(TIMESTAMP, nullable=False, index=True)
+    timestamp = Column(TIMESTAMP, primary_key=True, nullable=False, index=True)
 
     # Common financial features
     volatility_7d = Column(Numeric(20, 8))
@@ -108,8 +112,8 @@ class Feature(Base):
     source = relationship('Source')
 
     __table_args__ = (
-        UniqueConstraint('source_id', 'timestamp', name='uq_features_source_timestamp'),
-        Index('idx_features_source_time', 'source_id', 'timestamp'),
+        # Unique index (not constraint) so TimescaleDB builds it per chunk
+        Index('uq_features_source_timestamp', 'source_id', 'timestamp', unique=True),
         Index('idx_features_regime', 'regime', postgresql_where=(regime.isnot(None))),
     )
 
@@ -121,11 +125,11 @@ class Feature(Base):
             'feature_id': self.feature_id,
             'source_id': self.source_id,
             'timestamp': self.timestamp.isoformat(),
-            'volatility_7d': float(self.volatility_7d) if self.volatility_7d else None,
-            'volatility_30d': float(self.volatility_30d) if self.volatility_30d else None,
-            'volatility_90d': float(self.volatility_90d) if self.volatility_90d else None,
-            'rsi_value': float(self.rsi_value) if self.rsi_value else None,
-            'funding_rate': float(self.funding_rate) if self.funding_rate else None,
+            'volatility_7d': float_or_none(self.volatility_7d),
+            'volatility_30d': float_or_none(self.volatility_30d),
+            'volatility_90d': float_or_none(self.volatility_90d),
+            'rsi_value': float_or_none(self.rsi_value),
+            'funding_rate': float_or_none(self.funding_rate),
             'regime': self.regime,
             'custom_features': self.custom_features,
         }
@@ -192,13 +196,13 @@ class Forecast(Base):
             'forecast_timestamp': self.forecast_timestamp.isoformat(),
             'target_timestamp': self.target_timestamp.isoformat(),
             'predicted_value': float(self.predicted_value),
-            'confidence_lower': float(self.confidence_lower) if self.confidence_lower else None,
-            'confidence_upper': float(self.confidence_upper) if self.confidence_upper else None,
+            'confidence_lower': float_or_none(self.confidence_lower),
+            'confidence_upper': float_or_none(self.confidence_upper),
             'model_name': self.model_name,
             'model_version': self.model_version,
-            'actual_value': float(self.actual_value) if self.actual_value else None,
-            'prediction_error': float(self.prediction_error) if self.prediction_error else None,
-            'percentage_error': float(self.percentage_error) if self.percentage_error else None,
+            'actual_value': float_or_none(self.actual_value),
+            'prediction_error': float_or_none(self.prediction_error),
+            'percentage_error': float_or_none(self.percentage_error),
         }
 
 
@@ -275,10 +279,10 @@ class BacktestResult(Base):
             'start_date': self.start_date.isoformat(),
             'end_date': self.end_date.isoformat(),
             'total_return': float(self.total_return),
-            'sharpe_ratio': float(self.sharpe_ratio) if self.sharpe_ratio else None,
-            'max_drawdown': float(self.max_drawdown) if self.max_drawdown else None,
+            'sharpe_ratio': float_or_none(self.sharpe_ratio),
+            'max_drawdown': float_or_none(self.max_drawdown),
             'total_trades': self.total_trades,
-            'win_rate': float(self.win_rate) if self.win_rate else None,
+            'win_rate': float_or_none(self.win_rate),
             'executed_at': self.executed_at.isoformat(),
         }
 
@@ -395,8 +399,8 @@ class MLModel(Base):
             'model_version': self.model_version,
             'model_type': self.model_type,
             'status': self.status,
-            'train_score': float(self.train_score) if self.train_score else None,
-            'validation_score': float(self.validation_score) if self.validation_score else None,
-            'test_score': float(self.test_score) if self.test_score else None,
+            'train_score': float_or_none(self.train_score),
+            'validation_score': float_or_none(self.validation_score),
+            'test_score': float_or_none(self.test_score),
             'deployed_at': self.deployed_at.isoformat() if self.deployed_at else None,
         }
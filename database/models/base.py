@@ -123,6 +123,11 @@ class PrecisionNumeric(TypeDecorator):
         return value
 
 
+def float_or_none(value):
+    """Numeric column value -> float, keeping NULL as None (0 stays 0.0)"""
+    return None if value is None else float(value)
+
+
 # ============================================================================
 # QUERY HELPERS
 # ============================================================================
@@ -0,0 +1,202 @@
+"""
+Binary COPY Helpers
+Stream query results out of PostgreSQL with COPY ... TO STDOUT (FORMAT BINARY)
+straight into NumPy arrays, and bulk load rows with COPY ... FROM STDIN,
+without building an ORM object per row
+"""
+
+import io
+import struct
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+
+# ============================================================================
+# BINARY COPY FORMAT
+# ============================================================================
+
+# 11-byte signature + int32 flags + int32 header extension length
+COPY_SIGNATURE = b'PGCOPY\n\xff\r\n\x00'
+COPY_HEADER_SIZE = len(COPY_SIGNATURE) + 8
+COPY_TRAILER = b'\xff\xff'
+
+# PostgreSQL timestamps are int64 microseconds since 2000-01-01 UTC
+PG_EPOCH_OFFSET_US = 946684800 * 1_000_000
+
+# Supported column kinds -> (SQL cast, big-endian wire dtype)
+# Every kind is 8 bytes wide, so each row has a fixed size and the whole
+# payload can be reinterpreted as a structured array in one call
+COLUMN_KINDS = {
+    'timestamp': ('{col}', '>i8'),
+    'float8': ("COALESCE(({col})::float8, 'NaN'::float8)", '>f8'),
+    'int8': ('({col})::int8', '>i8'),
+}
+
+
+def _row_dtype(columns):
+    """Structured dtype for one binary COPY tuple of 8-byte fields."""
+    fields = [('field_count', '>i2')]
+    for name, kind in columns:
+        fields.append((f'{name}__len', '>i4'))
+        fields.append((name, COLUMN_KINDS[kind][1]))
+    return np.dtype(fields)
+
+
+def _decode_copy_binary(payload, columns):
+    """
+    Decode a binary COPY payload of fixed-width columns into NumPy arrays.
+
+    Args:
+        payload: bytes returned by COPY ... TO STDOUT WITH (FORMAT BINARY)
+        columns: list of (name, kind) tuples in SELECT order
+
+    Returns:
+        dict: {name: np.ndarray} (timestamps as datetime64[us], others native-endian)
+    """
+    if payload[:len(COPY_SIGNATURE)] != COPY_SIGNATURE:
+        raise ValueError("Not a PostgreSQL binary COPY payload")
+
+    ext_len = int.from_bytes(payload[COPY_HEADER_SIZE - 4:COPY_HEADER_SIZE], 'big')
+    body_start = COPY_HEADER_SIZE + ext_len
+    body_end = len(payload) - len(COPY_TRAILER)
+    if payload[body_end:] != COPY_TRAILER:
+        raise ValueError("Binary COPY payload is missing its trailer")
+
+    dtype = _row_dtype(columns)
+    if (body_end - body_start) % dtype.itemsize:
+        raise ValueError("Binary COPY rows are not fixed width (NULL in a non-nullable column?)")
+
+    rows = np.frombuffer(payload, dtype=dtype, offset=body_start,
+                         count=(body_end - body_start) // dtype.itemsize)
+
+    if rows.size and (np.any(rows['field_count'] != len(columns)) or
+                      any(np.any(rows[f'{name}__len'] != 8) for name, _ in columns)):
+        raise ValueError("Unexpected field layout in binary COPY payload")
+
+    arrays = {}
+    for name, kind in columns:
+        values = rows[name].astype(COLUMN_KINDS[kind][1][1:])  # native byte order, contiguous
+        if kind == 'timestamp':
+            values = (values + PG_EPOCH_OFFSET_US).view('datetime64[us]')
+        arrays[name] = values
+    return arrays
+
+
+# ============================================================================
+# QUERY HELPERS
+# ============================================================================
+
+def copy_to_arrays(session: Session, query: str, columns: list, params: dict = None) -> dict:
+    """
+    Run a SELECT through binary COPY and return its columns as NumPy arrays
+
+    Args:
+        session: SQLAlchemy session (the COPY runs on its current connection)
+        query: SELECT statement (psycopg2 %(name)s placeholders allowed)
+        columns: list of (name, kind) for the columns to extract, kind is
+                 'timestamp', 'float8' (NULL -> NaN) or 'int8' (NOT NULL)
+        params: Values for the query placeholders
+
+    Example:
+        arrays = copy_to_arrays(
+            db,
+            "SELECT timestamp, close FROM timeseries_data WHERE source_id = %(sid)s ORDER BY timestamp",
+            [('timestamp', 'timestamp'), ('close', 'float8')],
+            {'sid': 1},
+        )
+        arrays['close']  # float64 array
+    """
+    select_list = ', '.join(
+        COLUMN_KINDS[kind][0].format(col=f'q."{name}"') + f' AS "{name}"'
+        for name, kind in columns
+    )
+
+    cursor = session.connection().connection.cursor()
+    try:
+        # COPY cannot take bind parameters, so psycopg2 inlines them safely
+        inner = cursor.mogrify(query, params).decode() if params else query
+        sql = f"COPY (SELECT {select_list} FROM ({inner}) AS q) TO STDOUT WITH (FORMAT BINARY)"
+
+        buffer = io.BytesIO()
+        cursor.copy_expert(sql, buffer)
+    finally:
+        cursor.close()
+
+    return _decode_copy_binary(buffer.getvalue(), columns)
+
+
+# ============================================================================
+# BULK INGEST
+# ============================================================================
+
+_PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_NULL_FIELD = struct.pack('>i', -1)
+_FIELD_ENCODERS = {
+    'int4': struct.Struct('>ii').pack,
+    'int8': struct.Struct('>iq').pack,
+    'float8': struct.Struct('>id').pack,
+    'timestamp': struct.Struct('>iq').pack,
+}
+_FIELD_SIZES = {'int4': 4, 'int8': 8, 'float8': 8, 'timestamp': 8}
+
+
+def _pg_timestamp(value):
+    """datetime (naive = UTC) or epoch milliseconds -> microseconds since 2000-01-01"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _PG_EPOCH) // _MICROSECOND
+    return int(value) * 1000 - PG_EPOCH_OFFSET_US
+
+
+def encode_copy_binary(rows, kinds) -> bytes:
+    """
+    Encode rows into the COPY ... FROM STDIN WITH (FORMAT BINARY) wire format
+
+    Args:
+        rows: Iterable of tuples, one value per column (None or NaN -> NULL)
+        kinds: Column kinds in tuple order ('int4', 'int8', 'float8', 'timestamp')
+
+    Returns:
+        bytes: Complete payload (header, tuples, trailer)
+    """
+    encoders = [(_FIELD_ENCODERS[kind], _FIELD_SIZES[kind], kind) for kind in kinds]
+    field_count = struct.pack('>h', len(kinds))
+
+    out = bytearray(COPY_SIGNATURE)
+    out += struct.pack('>ii', 0, 0)
+    for row in rows:
+        out += field_count
+        for value, (encode, size, kind) in zip(row, encoders):
+            if value is None or value != value:  # NULL or NaN
+                out += _NULL_FIELD
+            elif kind == 'timestamp':
+                out += encode(size, _pg_timestamp(value))
+            else:
+                out += encode(size, value)
+    out += COPY_TRAILER
+    return bytes(out)
+
+
+def copy_from_rows(session: Session, table: str, columns: list, rows) -> None:
+    """
+    Bulk load rows with binary COPY FROM STDIN (single round-trip, no per-row INSERT)
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        table: Target table name
+        columns: list of (name, kind) in tuple order, kind as in encode_copy_binary
+        rows: Iterable of tuples
+    """
+    payload = encode_copy_binary(rows, [kind for _, kind in columns])
+    column_list = ', '.join(f'"{name}"' for name, _ in columns)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({column_list}) FROM STDIN WITH (FORMAT BINARY)",
+            io.BytesIO(payload)
+        )
+    finally:
+        cursor.close()
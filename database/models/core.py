@@ -1,19 +1,23 @@
 """
 Core ORM Models
-Sources, TimeseriesData, TimeIndex, MarketCalendar
+Sources, TimeseriesData, TimeIndex, MarketCalendar, IngestBatch
 """
 
 from sqlalchemy import (
     Column, Integer, String, DateTime, Boolean, Interval,
-    Date, Time, Text, Numeric, ForeignKey, Index,
-    CheckConstraint, UniqueConstraint, SmallInteger
+    Date, Time, Text, ForeignKey, Index,
+    CheckConstraint, UniqueConstraint, SmallInteger, BigInteger, cast
 )
-from sqlalchemy.dialects.postgresql import JSONB, ENUM, TIMESTAMP
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, ENUM, TIMESTAMP, DOUBLE_PRECISION
+from sqlalchemy.orm import relationship, Session
 from sqlalchemy.sql import func
-from datetime import datetime
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from psycopg2.extras import execute_values
 
 from .base import Base
+from .binary_copy import copy_from_rows
 
 # Import custom ENUM types (must match 02_enums.sql)
 DataTypeEnum = ENUM(
@@ -35,6 +39,10 @@ MarketEnum = ENUM(
     create_type=False
 )
 
+# Epoch arithmetic for millisecond timestamps (exact integers, no float round-trip)
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MILLISECOND = timedelta(milliseconds=1)
+
 
 # ============================================================================
 # SOURCES TABLE (Data Plugin Registry)
@@ -155,6 +163,25 @@ class MarketCalendar(Base):
         return f"<MarketCalendar(date={self.date}, market={self.market}, holiday={self.is_holiday})>"
 
 
+# ============================================================================
+# INGEST BATCH LOG
+# ============================================================================
+
+class IngestBatch(Base):
+    """One row per ingestion run (audit info shared by every row it wrote)"""
+    __tablename__ = 'ingest_batches'
+
+    batch_id = Column(Integer, primary_key=True, autoincrement=True)
+    source_id = Column(Integer, ForeignKey('sources.source_id', ondelete='SET NULL'), nullable=True, index=True)
+    started_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    completed_at = Column(TIMESTAMP, nullable=True)
+    row_count = Column(Integer, nullable=True)
+    ingested_by = Column(String(100), nullable=False, default='system')
+
+    def __repr__(self):
+        return f"<IngestBatch(id={self.batch_id}, source={self.source_id}, rows={self.row_count}, started={self.started_at})>"
+
+
 # ============================================================================
 # TIMESERIES DATA TABLE (Unified Storage - Hypertable)
 # ============================================================================
@@ -171,25 +198,25 @@ class TimeseriesData(Base):
     date_only = Column(Date)  # Generated column in DB
 
     # OHLCV columns (NULL for simple data)
-    # NUMERIC(24, 8) supports values up to $1 quadrillion (needed for macro data like Fed RRP)
-    open = Column(Numeric(24, 8), nullable=True)
-    high = Column(Numeric(24, 8), nullable=True)
-    low = Column(Numeric(24, 8), nullable=True)
-    close = Column(Numeric(24, 8), nullable=True)
-    volume = Column(Numeric(24, 8), nullable=True)
+    # DOUBLE PRECISION: fixed 8 bytes, decodes straight to Python float (no Decimal),
+    # and covers macro-scale values like Fed RRP (~15 significant digits)
+    open = Column(DOUBLE_PRECISION, nullable=True)
+    high = Column(DOUBLE_PRECISION, nullable=True)
+    low = Column(DOUBLE_PRECISION, nullable=True)
+    close = Column(DOUBLE_PRECISION, nullable=True)
+    volume = Column(DOUBLE_PRECISION, nullable=True)
 
     # Simple value column (NULL for OHLCV)
-    value = Column(Numeric(24, 8), nullable=True)
+    value = Column(DOUBLE_PRECISION, nullable=True)
 
     # Data quality metadata
     quality_score = Column(SmallInteger, default=100)
     is_anomaly = Column(Boolean, default=False, index=True)
     is_validated = Column(Boolean, default=True)
 
-    # Audit fields
-    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
-    updated_at = Column(TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False)
-    ingestion_timestamp = Column(TIMESTAMP, default=func.now(), nullable=False)
+    # Audit: which ingestion run wrote the row (timestamps live in ingest_batches,
+    # keeping the per-row heap tuple narrow)
+    ingested_batch_id = Column(Integer, ForeignKey('ingest_batches.batch_id', ondelete='SET NULL'), nullable=True)
 
     # Relationships
     source = relationship('Source', back_populates='timeseries_data')
@@ -198,7 +225,12 @@ class TimeseriesData(Base):
     __table_args__ = (
         CheckConstraint('quality_score BETWEEN 0 AND 100', name='chk_quality_score'),
         CheckConstraint('high >= low', name='chk_high_low'),
-        Index('idx_timeseries_source_time', 'source_id', 'timestamp', postgresql_using='btree'),
+        # Newest-first per source: "latest N" / recent-cutoff scans start at the
+        # front of the index, which lives in the hot (most recent) chunk
+        Index('idx_timeseries_source_time', source_id, timestamp.desc(), postgresql_using='btree'),
+        # Covering index: time-range scans of close/value run as index-only scans
+        Index('idx_timeseries_scan_covering', source_id, timestamp.desc(),
+              postgresql_include=['close', 'value', 'quality_score']),
         Index('idx_timeseries_date', 'date_only'),
         Index('idx_timeseries_quality', 'quality_score', postgresql_where=(quality_score < 80)),
         Index('idx_timeseries_anomalies', 'source_id', 'timestamp', postgresql_where=(is_anomaly == True)),
@@ -208,20 +240,33 @@ class TimeseriesData(Base):
         val = self.close if self.close is not None else self.value
         return f"<TimeseriesData(source={self.source_id}, time={self.timestamp}, value={val}, quality={self.quality_score})>"
 
+    @hybrid_property
+    def timestamp_ms(self):
+        """Unix epoch milliseconds (integer arithmetic, naive timestamps are UTC)"""
+        ts = self.timestamp
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return (ts - UNIX_EPOCH) // MILLISECOND
+
+    @timestamp_ms.expression
+    def timestamp_ms(cls):
+        """Server-side epoch milliseconds, e.g. select(TimeseriesData.timestamp_ms)"""
+        return cast(func.floor(func.extract('epoch', cls.timestamp) * 1000), BigInteger)
+
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
         return {
             'source_id': self.source_id,
-            'timestamp': int(self.timestamp.timestamp() * 1000),  # Milliseconds
+            'timestamp': self.timestamp_ms,  # Milliseconds
             'date': self.date_only.isoformat() if self.date_only else None,
             # OHLCV fields
-            'open': float(self.open) if self.open else None,
-            'high': float(self.high) if self.high else None,
-            'low': float(self.low) if self.low else None,
-            'close': float(self.close) if self.close else None,
-            'volume': float(self.volume) if self.volume else None,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
             # Simple value
-            'value': float(self.value) if self.value else None,
+            'value': self.value,
             # Quality
             'quality_score': self.quality_score,
             'is_anomaly': self.is_anomaly,
@@ -229,22 +274,71 @@ class TimeseriesData(Base):
 
     def to_simple_format(self):
         """Convert to [timestamp_ms, value] format for frontend"""
-        timestamp_ms = int(self.timestamp.timestamp() * 1000)
-        val = float(self.close if self.close is not None else self.value)
-        return [timestamp_ms, val]
+        val = self.close if self.close is not None else self.value
+        return [self.timestamp_ms, val]
 
     def to_ohlcv_format(self):
         """Convert to [timestamp_ms, open, high, low, close, volume] format"""
-        timestamp_ms = int(self.timestamp.timestamp() * 1000)
-        return [
-            timestamp_ms,
-            float(self.open) if self.open else None,
-            float(self.high) if self.high else None,
-            float(self.low) if self.low else None,
-            float(self.close) if self.close else None,
-            float(self.volume) if self.volume else None,
+        return [self.timestamp_ms, self.open, self.high, self.low, self.close, self.volume]
+
+    # Column spec for copy_to_arrays() when loading rows in bulk
+    COPY_COLUMNS = [
+        ('timestamp', 'timestamp'),
+        ('open', 'float8'),
+        ('high', 'float8'),
+        ('low', 'float8'),
+        ('close', 'float8'),
+        ('volume', 'float8'),
+        ('value', 'float8'),
+    ]
+
+    @classmethod
+    def rows_from_arrays(cls, arrays: dict) -> list:
+        """
+        Batch equivalent of to_ohlcv_format/to_simple_format
+
+        Args:
+            arrays: Column arrays from copy_to_arrays(..., COPY_COLUMNS)
+                    (timestamps as datetime64, NULL values as NaN)
+
+        Returns:
+            list: [[timestamp_ms, open, high, low, close, volume], ...] for OHLCV rows,
+                  [[timestamp_ms, value], ...] for simple rows (missing volume -> 0.0,
+                  rows with neither OHLCV nor value are skipped)
+        """
+        # datetime64[ms] -> int64 is a reinterpretation, not a per-row conversion
+        timestamps_ms = arrays['timestamp'].astype('datetime64[ms]').view(np.int64)
+        is_ohlcv = ~np.isnan(arrays['open'])
+        is_simple = ~is_ohlcv & ~np.isnan(arrays['value'])
+
+        ohlcv_rows = [
+            [ts] + values
+            for ts, values in zip(
+                timestamps_ms[is_ohlcv].tolist(),
+                np.column_stack([
+                    arrays['open'][is_ohlcv],
+                    arrays['high'][is_ohlcv],
+                    arrays['low'][is_ohlcv],
+                    arrays['close'][is_ohlcv],
+                    np.nan_to_num(arrays['volume'][is_ohlcv], nan=0.0),
+                ]).tolist()
+            )
+        ]
+        simple_rows = [
+            [ts, value]
+            for ts, value in zip(timestamps_ms[is_simple].tolist(), arrays['value'][is_simple].tolist())
         ]
 
+        if not simple_rows:
+            return ohlcv_rows
+        if not ohlcv_rows:
+            return simple_rows
+
+        # Mixed source: restore timestamp order across both row kinds
+        order = np.argsort(np.concatenate([np.flatnonzero(is_ohlcv), np.flatnonzero(is_simple)]), kind='stable')
+        combined = ohlcv_rows + simple_rows
+        return [combined[i] for i in order.tolist()]
+
     @classmethod
     def from_simple(cls, source_id: int, timestamp: datetime, value: float, **kwargs):
         """Create TimeseriesData from simple [timestamp, value] format"""
@@ -270,3 +364,52 @@ class TimeseriesData(Base):
             volume=volume,
             **kwargs
         )
+
+    # Column order of the tuples accepted by bulk_insert_copy / bulk_insert_values
+    INGEST_COLUMNS = [
+        ('source_id', 'int4'),
+        ('timestamp', 'timestamp'),
+        ('open', 'float8'),
+        ('high', 'float8'),
+        ('low', 'float8'),
+        ('close', 'float8'),
+        ('volume', 'float8'),
+        ('value', 'float8'),
+    ]
+
+    @classmethod
+    def bulk_insert_copy(cls, session: Session, rows):
+        """
+        Bulk insert with binary COPY FROM STDIN (fastest path for new rows)
+
+        Args:
+            session: SQLAlchemy session (caller commits)
+            rows: Iterable of (source_id, timestamp, open, high, low, close, volume, value)
+                  tuples; timestamp is a datetime or epoch milliseconds, None -> NULL
+
+        Note: COPY has no ON CONFLICT; use bulk_upsert() when rows may already exist.
+        """
+        copy_from_rows(session, cls.__tablename__, cls.INGEST_COLUMNS, rows)
+
+    @classmethod
+    def bulk_insert_values(cls, session: Session, rows, page_size: int = 1000):
+        """
+        Bulk insert with psycopg2 execute_values (multi-row INSERT pages)
+
+        Same tuple layout as bulk_insert_copy (timestamp must be a datetime here);
+        use where COPY is not available
+        (e.g. connection poolers that do not support the COPY protocol).
+        Existing (source_id, timestamp) rows are left unchanged.
+        """
+        column_list = ', '.join(name for name, _ in cls.INGEST_COLUMNS)
+        cursor = session.connection().connection.cursor()
+        try:
+            execute_values(
+                cursor,
+                f"INSERT INTO {cls.__tablename__} ({column_list}) VALUES %s "
+                "ON CONFLICT (source_id, timestamp) DO NOTHING",
+                rows,
+                page_size=page_size
+            )
+        finally:
+            cursor.close()
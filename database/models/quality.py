@@ -11,7 +11,7 @@ from sqlalchemy.dialects.postgresql import JSONB, ENUM, TIMESTAMP, ARRAY, INET
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from .base import Base
+from .base import Base, float_or_none
 
 # Import custom ENUM types
 DataTypeEnum = ENUM(
@@ -130,10 +130,10 @@ class Anomaly(Base):
             'detected_at': self.detected_at.isoformat(),
             'anomaly_type': self.anomaly_type,
             'severity': self.severity,
-            'value': float(self.value) if self.value else None,
-            'z_score': float(self.z_score) if self.z_score else None,
-            'expected_value': float(self.expected_value) if self.expected_value else None,
-            'deviation_pct': float(self.deviation_pct) if self.deviation_pct else None,
+            'value': float_or_none(self.value),
+            'z_score': float_or_none(self.z_score),
+            'expected_value': float_or_none(self.expected_value),
+            'deviation_pct': float_or_none(self.deviation_pct),
             'is_blackswan': self.is_blackswan,
             'reviewed': self.reviewed,
             'is_false_positive': self.is_false_positive,
@@ -247,8 +247,8 @@ class TimeseriesArchive(Base):
             'archive_id': self.archive_id,
             'source_id': self.source_id,
             'timestamp': self.timestamp.isoformat(),
-            'value': float(self.value) if self.value else None,
-            'close': float(self.close) if self.close else None,
+            'value': float_or_none(self.value),
+            'close': float_or_none(self.close),
             'deleted_at': self.deleted_at.isoformat(),
             'deleted_by': self.deleted_by,
             'deletion_reason': self.deletion_reason,
@@ -95,6 +95,23 @@ COMMENT ON TABLE market_calendar IS 'Market-specific trading schedule (holidays,
 COMMENT ON COLUMN market_calendar.open_time IS 'Market opening time with timezone (e.g., 09:30:00-05 for US Eastern)';
 
 
+-- ============================================================================
+-- INGEST BATCH LOG (Per-run audit info for timeseries_data)
+-- ============================================================================
+CREATE TABLE ingest_batches (
+    batch_id SERIAL PRIMARY KEY,
+    source_id INT REFERENCES sources(source_id) ON DELETE SET NULL,
+    started_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    completed_at TIMESTAMPTZ,
+    row_count INT,
+    ingested_by VARCHAR(100) NOT NULL DEFAULT 'system'
+);
+
+CREATE INDEX idx_ingest_batches_source ON ingest_batches(source_id);
+
+COMMENT ON TABLE ingest_batches IS 'One row per ingestion run; timeseries_data rows reference it instead of carrying their own audit timestamps';
+
+
 -- ============================================================================
 -- TIMESERIES DATA TABLE (Unified Storage - Will become Hypertable)
 -- ============================================================================
@@ -104,24 +121,23 @@ CREATE TABLE timeseries_data (
     date_only DATE GENERATED ALWAYS AS (timestamp::DATE) STORED,
 
     -- OHLCV columns (NULL for simple/calculated data)
-    open NUMERIC(20,8),
-    high NUMERIC(20,8),
-    low NUMERIC(20,8),
-    close NUMERIC(20,8),
-    volume NUMERIC(30,8),
+    -- DOUBLE PRECISION: fixed-width 8 bytes, decodes directly to float
+    open DOUBLE PRECISION,
+    high DOUBLE PRECISION,
+    low DOUBLE PRECISION,
+    close DOUBLE PRECISION,
+    volume DOUBLE PRECISION,
 
     -- Simple value column (NULL for OHLCV data)
-    value NUMERIC(20,8),
+    value DOUBLE PRECISION,
 
     -- Data quality metadata
     quality_score SMALLINT DEFAULT 100,
     is_anomaly BOOLEAN DEFAULT FALSE,
     is_validated BOOLEAN DEFAULT TRUE,
 
-    -- Audit fields
-    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
-    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
-    ingestion_timestamp TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    -- Audit (ingestion run that wrote the row)
+    ingested_batch_id INT REFERENCES ingest_batches(batch_id) ON DELETE SET NULL,
 
     PRIMARY KEY (source_id, timestamp),
 
@@ -148,6 +164,8 @@ CREATE TABLE timeseries_data (
 
 -- Indexes (before hypertable conversion)
 CREATE INDEX idx_timeseries_source_time ON timeseries_data (source_id, timestamp DESC);
+-- Covering index so close/value range scans are index-only (no heap fetches)
+CREATE INDEX idx_timeseries_scan_covering ON timeseries_data (source_id, timestamp DESC) INCLUDE (close, value, quality_score);
 CREATE INDEX idx_timeseries_date ON timeseries_data (date_only);
 CREATE INDEX idx_timeseries_quality ON timeseries_data (quality_score) WHERE quality_score < 80;
 CREATE INDEX idx_timeseries_anomalies ON timeseries_data (source_id, timestamp) WHERE is_anomaly = TRUE;
@@ -156,7 +174,7 @@ COMMENT ON TABLE timeseries_data IS 'Unified time-series storage for all dataset
 COMMENT ON COLUMN timeseries_data.timestamp IS 'Unix timestamp in milliseconds, normalized to UTC';
 COMMENT ON COLUMN timeseries_data.value IS 'For simple [timestamp, value] format (oscillators, dominance, etc.)';
 COMMENT ON COLUMN timeseries_data.quality_score IS '0-100 score based on completeness, timeliness, consistency';
-COMMENT ON COLUMN timeseries_data.ingestion_timestamp IS 'When data was inserted into database (for lag tracking)';
+COMMENT ON COLUMN timeseries_data.ingested_batch_id IS 'Ingestion run that wrote the row (see ingest_batches for timing, for lag tracking)';
 
 
 -- ============================================================================
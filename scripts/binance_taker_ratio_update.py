@@ -9,11 +9,16 @@ Source: Binance Futures API (FREE)
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
 
+from dataset_io import (
+    read_last_record, read_first_record, append_records, select_new_records,
+    save_record_count, get_record_count, clone_file
+)
+
 # Configuration
 BINANCE_FUTURES_BASE = 'https://fapi.binance.com'
 SYMBOL = 'BTCUSDT'
@@ -22,24 +27,28 @@ LIMIT = 30  # Fetch last 30 days for redundancy
 
 DATA_FILE = Path('historical_data/options_pcr_cvd/taker_ratio_3m.json')
 BACKUP_FILE = Path('historical_data/options_pcr_cvd/taker_ratio_3m.backup.json')
+COUNT_FILE = DATA_FILE.with_suffix('.count')  # Row count sidecar (avoids a full parse)
+
+# Shared HTTP session: keep-alive connections are reused across requests
+# (no new TCP/TLS handshake per call), responses are gzip-compressed
+SESSION = requests.Session()
+SESSION.headers.update({'Accept-Encoding': 'gzip, deflate'})
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 
 def backup_data():
     """Create backup before updating."""
     if DATA_FILE.exists():
-        import shutil
-        shutil.copy(DATA_FILE, BACKUP_FILE)
+        clone_file(DATA_FILE, BACKUP_FILE)
         print(f"[Backup] Created: {BACKUP_FILE}")
 
 
 def get_last_timestamp():
     """Get last timestamp from dataset."""
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-        if data:
-            last_ts = data[-1][0]
-            return last_ts, len(data)
+        last_record = read_last_record(DATA_FILE)
+        if last_record:
+            return last_record[0], get_record_count(DATA_FILE, COUNT_FILE)
         return None, 0
     except FileNotFoundError:
         print(f"[WARNING] File not found: {DATA_FILE}")
@@ -62,7 +71,7 @@ def fetch_recent_taker_ratio(days=30):
 
     try:
         print(f"[Fetching] Last {days} days from Binance Futures API...")
-        response = requests.get(url, params=params, timeout=30)
+        response = SESSION.get(url, params=params, timeout=30)
         response.raise_for_status()
 
         data = response.json()
@@ -78,7 +87,8 @@ def fetch_recent_taker_ratio(days=30):
             ratio = float(point['buySellRatio'])
             taker_data.append([timestamp, ratio])
 
-        taker_data.sort(key=lambda x: x[0])
+        # No sort: the endpoint returns ascending periods, and
+        # select_new_records() orders and dedupes before saving anyway
         print(f"[Fetched] {len(taker_data)} records")
 
         return taker_data
@@ -114,48 +124,36 @@ def update_dataset(days=30):
         print("[ERROR] No new data fetched")
         return
 
-    # Load existing data
-    try:
-        with open(DATA_FILE, 'r') as f:
-            existing_data = json.load(f)
-    except FileNotFoundError:
-        existing_data = []
-
-    # Merge and deduplicate
-    combined = existing_data + new_data
-
-    seen = set()
-    unique_data = []
-
-    for record in combined:
-        ts = record[0]
-        if ts not in seen:
-            seen.add(ts)
-            unique_data.append(record)
-
-    unique_data.sort(key=lambda x: x[0])
+    # Stored data is sorted, so only rows from its last timestamp on matter.
+    # A re-fetched last period replaces the stored one: it was still forming
+    # at the previous run and the latest values win
+    # (last_ts comes from get_last_timestamp above, so the tail is read once)
+    cutoff = last_ts if last_ts is not None else -1
+    append = select_new_records(new_data, cutoff - 1)
+    replace_last = bool(append) and append[0][0] == cutoff
 
-    added = len(unique_data) - existing_count
+    added = len(append) - replace_last
+    total = existing_count + added
 
     print(f"[Added] {added} new unique records")
-    print(f"[Total] {len(unique_data)} records")
+    print(f"[Total] {total} records")
 
-    # Save
+    # Save (in-place append: only the new rows are written)
     DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(DATA_FILE, 'w') as f:
-        json.dump(unique_data, f)
+    append_records(DATA_FILE, append, replace_last)
+    save_record_count(COUNT_FILE, total)
 
     print(f"[SAVED] {DATA_FILE}")
 
     # Stats
-    if unique_data:
-        first_dt = datetime.fromtimestamp(unique_data[0][0]/1000, tz=timezone.utc)
-        last_dt = datetime.fromtimestamp(unique_data[-1][0]/1000, tz=timezone.utc)
+    if total:
+        first_dt = datetime.fromtimestamp(read_first_record(DATA_FILE)[0]/1000, tz=timezone.utc)
+        last_dt = datetime.fromtimestamp(read_last_record(DATA_FILE)[0]/1000, tz=timezone.utc)
 
         print(f"\n[Dataset Info]")
         print(f"  Range: {first_dt.date()} to {last_dt.date()}")
-        print(f"  Records: {len(unique_data)}")
+        print(f"  Records: {total}")
         print(f"  Granularity: 1 day")
         print(f"  Last Update: {last_dt.date()}")
 
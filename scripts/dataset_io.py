@@ -0,0 +1,191 @@
+"""
+Dataset file helpers shared by the Binance update scripts
+
+Datasets are JSON arrays of flat rows ([timestamp_ms, ...]) sorted by
+timestamp. New rows are appended in place and the file ends are read
+directly, so a daily update never parses or rewrites the whole history.
+"""
+
+import os
+import shutil
+import numpy as np
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: backups always copy
+    fcntl = None
+
+TAIL_BYTES = 4096
+FICLONE = 0x40049409  # Linux ioctl: copy-on-write clone (btrfs, XFS with reflink)
+
+
+def load_json(path):
+    """Parse a JSON file with orjson."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def write_atomic(path, payload):
+    """
+    Replace path with payload atomically: write a temp file in the same
+    directory, then os.replace() it over the original, so a crash mid-write
+    never leaves a truncated file behind.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+def save_json(path, data):
+    """Write data as compact JSON with orjson."""
+    write_atomic(path, orjson.dumps(data))
+
+
+def read_last_record(path):
+    """Parse only the last row of a JSON array file by reading its tail."""
+    with open(path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - TAIL_BYTES))
+        tail = f.read()
+
+    # Last ']' closes the outer array, the one before it closes the last row
+    end = tail.rfind(b']', 0, tail.rfind(b']'))
+    start = tail.rfind(b'[', 0, end) if end >= 0 else -1
+    if start < 0:
+        return None
+    row = tail[start:end + 1]
+    return orjson.loads(row)
+
+
+def read_first_record(path):
+    """Parse only the first row of a JSON array file by reading its head."""
+    with open(path, 'rb') as f:
+        head = f.read(TAIL_BYTES)
+
+    start = head.find(b'[', head.find(b'[') + 1)
+    end = head.find(b']', start) if start >= 0 else -1
+    if end < 0:
+        return None
+    row = head[start:end + 1]
+    return orjson.loads(row)
+
+
+def append_records(path, records, replace_last=False):
+    """
+    Append rows to a JSON array file in place.
+
+    Only the end of the file is rewritten, so the cost is proportional to
+    the new rows rather than the whole history. With replace_last, the first
+    row overwrites the stored last row (same timestamp, newer values).
+    Creates the file if needed.
+    """
+    if not path.exists():
+        save_json(path, records)
+        return
+    if not records:
+        return
+
+    # Serialize all rows in one call and write them straight from that buffer
+    # (the memoryview slice drops the outer brackets without copying)
+    payload = memoryview(orjson.dumps(records))[1:-1]
+
+    with open(path, 'r+b') as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - TAIL_BYTES)
+        f.seek(tail_start)
+        tail = f.read()
+
+        close = tail.rfind(b']')
+        if close < 0:
+            raise ValueError(f"{path} is not a JSON array")
+
+        if replace_last:
+            # Start of the last row; the separator before it is kept
+            position = tail.rfind(b'[', 0, tail.rfind(b']', 0, close))
+            separator = b''
+        else:
+            position = close
+            separator = b'' if tail[:close].rstrip().endswith(b'[') else b','
+
+        f.seek(tail_start + position)
+        try:
+            f.write(separator)
+            f.write(payload)
+            f.write(b']')
+            f.truncate()
+        except BaseException:
+            # Restore the original file end (e.g. disk full, Ctrl+C)
+            f.seek(tail_start + position)
+            f.write(tail[position:])
+            f.truncate()
+            raise
+
+
+def select_new_records(records, cutoff, interval_ms=None):
+    """
+    Rows with a timestamp after cutoff, sorted, keeping the last row per timestamp.
+
+    A timestamp repeated within one fetch keeps its latest observation, the
+    same rule that replaces the stored last row. Timestamps are sorted and
+    deduplicated as one int64 array (np.unique over the reversed array, so
+    the first hit is the last row) instead of through a Python set and a
+    key-function sort. With interval_ms (e.g. minute-aligned kline open
+    times), each timestamp maps to a slot in a dense array over the fetched
+    window instead: dedup and ordering are one indexed pass (O(n), no
+    hashing and no sort), falling back to np.unique if any timestamp is off
+    the grid.
+    """
+    if not records:
+        return []
+
+    timestamps = np.fromiter((record[0] for record in records), dtype=np.int64, count=len(records))
+    is_new = timestamps > cutoff
+    if not is_new.any():
+        return []
+
+    offsets = timestamps - timestamps[is_new].min()
+    if interval_ms is None or (offsets[is_new] % interval_ms).any():
+        unique_ts, reversed_index = np.unique(timestamps[::-1], return_index=True)
+        last_index = len(records) - 1 - reversed_index
+        return [records[i] for i in last_index[unique_ts > cutoff].tolist()]
+
+    # Last row index per slot; empty slots keep the sentinel -1
+    row_index = np.flatnonzero(is_new)
+    last_index = np.full(offsets[row_index].max() // interval_ms + 1, -1, dtype=np.int64)
+    np.maximum.at(last_index, offsets[row_index] // interval_ms, row_index)
+    return [records[i] for i in last_index[last_index >= 0].tolist()]
+
+
+def save_record_count(count_file, count):
+    """Record the dataset row count in its sidecar file."""
+    write_atomic(count_file, str(count).encode())
+
+
+def get_record_count(data_file, count_file):
+    """Row count from the sidecar, recounted with a full parse if missing or stale."""
+    if count_file.exists() and count_file.stat().st_mtime >= data_file.stat().st_mtime:
+        return int(count_file.read_text())
+
+    count = len(load_json(data_file))
+    save_record_count(count_file, count)
+    return count
+
+
+def clone_file(src, dst):
+    """
+    Copy src to dst as a copy-on-write clone when the filesystem supports it
+    (shares data blocks, no bytes copied), otherwise as a regular copy.
+
+    Not a hardlink: the dataset is appended in place, which would also
+    modify a hardlinked backup.
+    """
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as s, open(dst, 'wb') as d:
+                fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+            return
+        except OSError:
+            pass  # Not Linux, no reflink support, or different filesystems
+    shutil.copy(src, dst)
@@ -5,52 +5,106 @@ Scans historical_data/*.json files and reports data point counts.
 """
 
 import json
+import mmap
 import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
+import orjson
+
+LARGE_FILE_BYTES = 5 * 1024 * 1024  # Above this, analyze_file reads only the file ends
+EDGE_BYTES = 4096
+COUNT_CHUNK_BYTES = 1024 * 1024
+NON_DATA_FILES = {'backfill_progress', 'backfill_results', 'validation_report', 'tradingview_update_log'}
 
 def get_json_files():
     """Get all JSON files from historical_data directory."""
     data_dir = Path(__file__).parent.parent / 'historical_data'
     return sorted(data_dir.glob('*.json'))
 
+def parse_json(raw):
+    """Parse JSON from bytes or a buffer with orjson."""
+    return orjson.loads(raw)
+
+def read_edge_rows(mm):
+    """
+    First and last rows of a memory-mapped JSON array-of-arrays file
+    (only the pages at either end are touched).
+    Returns None when the file is not an array of arrays.
+    """
+    head = mm[:EDGE_BYTES]
+    tail = mm[-EDGE_BYTES:]
+
+    outer = head.find(b'[')
+    if outer < 0 or head[:outer].strip() or not head[outer + 1:].lstrip().startswith(b'['):
+        return None
+
+    start = head.find(b'[', outer + 1)
+    first = parse_json(head[start:head.find(b']', start) + 1])
+
+    end = tail.rfind(b']', 0, tail.rfind(b']'))
+    last = parse_json(tail[tail.rfind(b'[', 0, end):end + 1])
+    return first, last
+
+def count_rows(mm):
+    """Rows in a memory-mapped JSON array of numeric arrays: inner '[' count, chunk by chunk."""
+    count = sum(
+        mm[offset:offset + COUNT_CHUNK_BYTES].count(b'[')
+        for offset in range(0, len(mm), COUNT_CHUNK_BYTES)
+    )
+    return count - 1  # Outer array
+
+def describe_rows(filepath, data_points, first, last):
+    """Metadata for a list dataset from its size and first/last rows."""
+    if isinstance(first, list):
+        if len(first) == 2:
+            format_type = "simple"  # [timestamp, value]
+        elif len(first) == 6:
+            format_type = "ohlcv"  # [timestamp, open, high, low, close, volume]
+        else:
+            format_type = f"array_{len(first)}"
+    else:
+        format_type = "unknown"
+
+    return {
+        "filename": filepath.stem,
+        "path": str(filepath),
+        "data_points": data_points,
+        "format": format_type,
+        "sample": first,
+        "date_range": {
+            "start": first[0] if isinstance(first, list) else None,
+            "end": last[0] if isinstance(first, list) else None
+        }
+    }
+
 def analyze_file(filepath):
     """Analyze a JSON file and return metadata."""
-    try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+    # Skip non-data files by name, before reading them
+    if filepath.stem in NON_DATA_FILES:
+        return None
 
-        # Skip non-data files
-        filename = filepath.stem
-        if filename in ['backfill_progress', 'backfill_results', 'validation_report', 'tradingview_update_log']:
-            return None
+    try:
+        # Memory-mapped: the OS pages in only what is read, and full parses
+        # read the mapping directly instead of a copied bytes object
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Large time series: read the first/last rows and count brackets
+            # instead of parsing the whole file
+            if len(mm) > LARGE_FILE_BYTES:
+                edges = read_edge_rows(mm)
+                if edges:
+                    first, last = edges
+                    return describe_rows(filepath, count_rows(mm), first, last)
+
+            with memoryview(mm) as view:
+                data = parse_json(view)
 
         # Determine data format
         if isinstance(data, list) and len(data) > 0:
-            sample = data[0]
-            if isinstance(sample, list):
-                if len(sample) == 2:
-                    format_type = "simple"  # [timestamp, value]
-                elif len(sample) == 6:
-                    format_type = "ohlcv"  # [timestamp, open, high, low, close, volume]
-                else:
-                    format_type = f"array_{len(sample)}"
-            else:
-                format_type = "unknown"
-
-            return {
-                "filename": filename,
-                "path": str(filepath),
-                "data_points": len(data),
-                "format": format_type,
-                "sample": data[0] if len(data) > 0 else None,
-                "date_range": {
-                    "start": data[0][0] if len(data) > 0 and isinstance(data[0], list) else None,
-                    "end": data[-1][0] if len(data) > 0 and isinstance(data[0], list) else None
-                }
-            }
+            return describe_rows(filepath, len(data), data[0], data[-1])
         elif isinstance(data, dict):
             return {
-                "filename": filename,
+                "filename": filepath.stem,
                 "path": str(filepath),
                 "data_points": "dict",
                 "format": "object",
@@ -83,8 +137,12 @@ def categorize_datasets():
 
     json_files = get_json_files()
 
-    for filepath in json_files:
-        info = analyze_file(filepath)
+    # Files are independent and parsing is CPU-bound, so analyze them in
+    # worker processes (one per core); map() keeps the sorted file order
+    with ProcessPoolExecutor() as executor:
+        infos = list(executor.map(analyze_file, json_files))
+
+    for info in infos:
         if not info:
             continue
 
@@ -145,7 +203,6 @@ def main():
 
             # Add date range for time series data
             if 'date_range' in item and item['date_range']['start']:
-                from datetime import datetime
                 start_ts = item['date_range']['start']
                 end_ts = item['date_range']['end']
                 dataset_info['date_range'] = {
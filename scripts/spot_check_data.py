@@ -2,14 +2,36 @@
 Spot-check data values to ensure no corruption occurred during migration attempts.
 """
 
-import json
+import mmap
+import numpy as np
+import orjson
+
+def _in_range(arr, lo, hi, closed=False):
+    """Vectorized range predicate: bool mask of lo < arr < hi (lo <= arr <= hi if closed, None = unbounded)."""
+    mask = np.ones(arr.shape, dtype=bool)
+    if lo is not None:
+        mask &= (arr >= lo) if closed else (arr > lo)
+    if hi is not None:
+        mask &= (arr <= hi) if closed else (arr < hi)
+    return mask
+
+def run_validators(values, validators):
+    """Evaluate {name: (lo, hi[, closed])} ranges over an array; print and return False on the first failure."""
+    for validator_name, bounds in validators.items():
+        valid = _in_range(values, *bounds)
+        if not valid.all():
+            print(f"  ERROR: {validator_name} failed for value {values[np.argmax(~valid)]}")
+            return False
+    return True
 
 def check_file(filepath, data_type, validators):
     """Check a JSON file and validate its data."""
     print(f"\nChecking {filepath}...")
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        # Parse straight from a read-only mapping (no intermediate bytes copy)
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
 
         if len(data) == 0:
             print(f"  WARNING: File is empty")
@@ -22,38 +44,35 @@ def check_file(filepath, data_type, validators):
             ts, o, h, l, c, v = last_record
             print(f"  Last record: timestamp={ts}, close=${c:,.2f}")
 
-            # Validate OHLCV relationships
-            if not (h >= c and h >= o and h >= l):
-                print(f"  ERROR: High ({h}) should be >= all other values")
-                return False
-            if not (l <= c and l <= o and l <= h):
-                print(f"  ERROR: Low ({l}) should be <= all other values")
-                return False
-            if c <= 0:
-                print(f"  ERROR: Close price ({c}) should be > 0")
-                return False
-            if v < 0:
-                print(f"  ERROR: Volume ({v}) should be >= 0")
-                return False
-
-            # Custom validators
-            for validator_name, validator_func in validators.items():
-                if not validator_func(c):
-                    print(f"  ERROR: {validator_name} failed for value {c}")
+            # Validate OHLCV relationships on every row (whole-column comparisons)
+            rows = np.asarray(data, dtype=np.float64)
+            _, opens, highs, lows, closes, volumes = rows.T
+            relationship_checks = [
+                ((highs >= closes) & (highs >= opens) & (highs >= lows), "High ({}) should be >= all other values", highs),
+                ((lows <= closes) & (lows <= opens) & (lows <= highs), "Low ({}) should be <= all other values", lows),
+                (closes > 0, "Close price ({}) should be > 0", closes),
+                (volumes >= 0, "Volume ({}) should be >= 0", volumes),
+            ]
+            for valid, message, column in relationship_checks:
+                if not valid.all():
+                    i = int(np.argmax(~valid))  # First failing row
+                    print(f"  ERROR: Row {i} (timestamp={int(rows[i, 0])}): " + message.format(column[i]))
                     return False
 
-            print(f"  [OK] OHLCV relationships valid, close price in expected range")
+            # Custom range validators (latest close only; the ranges are current-regime sanity bounds)
+            if not run_validators(closes[-1:], validators):
+                return False
+
+            print(f"  [OK] OHLCV relationships valid for all {len(rows):,} rows, close price in expected range")
             return True
 
         elif data_type == "simple":
             ts, value = last_record
             print(f"  Last record: timestamp={ts}, value={value}")
 
-            # Custom validators
-            for validator_name, validator_func in validators.items():
-                if not validator_func(value):
-                    print(f"  ERROR: {validator_name} failed for value {value}")
-                    return False
+            # Custom range validators
+            if not run_validators(np.asarray([value], dtype=np.float64), validators):
+                return False
 
             print(f"  [OK] Value in expected range")
             return True
@@ -71,30 +90,31 @@ def main():
     print("DATA VALUE SPOT CHECK")
     print("=" * 80)
 
+    # Validators are (lo, hi) exclusive ranges, (lo, hi, True) inclusive, None = unbounded
     checks = [
         ("historical_data/btc_price.json", "ohlcv", {
-            "BTC price $10k-$150k": lambda x: 10000 < x < 150000
+            "BTC price $10k-$150k": (10_000, 150_000)
         }),
         ("historical_data/rsi_btc.json", "simple", {
-            "RSI 0-100": lambda x: 0 <= x <= 100
+            "RSI 0-100": (0, 100, True)
         }),
         ("historical_data/adx_btc.json", "simple", {
-            "ADX 0-100": lambda x: 0 <= x <= 100
+            "ADX 0-100": (0, 100, True)
         }),
         ("historical_data/atr_btc.json", "simple", {
-            "ATR > 0": lambda x: x > 0
+            "ATR > 0": (0, None)
         }),
         ("historical_data/funding_rate_btc.json", "simple", {
-            "Funding rate -1% to +1%": lambda x: -0.01 < x < 0.01
+            "Funding rate -1% to +1%": (-0.01, 0.01)
         }),
         ("historical_data/gold_price.json", "ohlcv", {
-            "Gold $1000-$5000": lambda x: 1000 < x < 5000
+            "Gold $1000-$5000": (1000, 5000)
         }),
         ("historical_data/btc_dominance.json", "simple", {
-            "BTC.D 30%-80%": lambda x: 30 < x < 80
+            "BTC.D 30%-80%": (30, 80)
         }),
         ("historical_data/dvol_btc.json", "simple", {
-            "DVOL 20-200": lambda x: 20 < x < 200
+            "DVOL 20-200": (20, 200)
         }),
     ]
 
@@ -7,6 +7,7 @@ Usage:
   python tradingview_daily_update.py           # Update all 27 symbols
   python tradingview_daily_update.py --days 3  # Fetch last 3 days only
   python tradingview_daily_update.py --dry-run # Test without saving
+  python tradingview_daily_update.py --force   # Also fetch symbols that are already fresh
 
 Run this daily via Windows Task Scheduler or cron to keep data fresh.
 
@@ -17,11 +18,16 @@ Requirements:
 
 import os
 import sys
-import json
 import time
 import argparse
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
+import numpy as np
+import orjson
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -29,7 +35,9 @@ sys.path.insert(0, str(project_root))
 
 from tvDatafeed import TvDatafeed, Interval
 from data.time_transformer import standardize_to_daily_utc
-from data.incremental_data_manager import save_historical_data, load_historical_data, merge_and_deduplicate
+from data.incremental_data_manager import (
+    save_historical_data, load_historical_data, merge_and_deduplicate, get_last_timestamp_fast
+)
 
 # Load credentials from environment
 from dotenv import load_dotenv
@@ -39,10 +47,17 @@ TV_USERNAME = os.getenv('TV_USERNAME')
 TV_PASSWORD = os.getenv('TV_PASSWORD')
 
 # Rate limiting configuration
-BASE_DELAY = 3          # Seconds between each symbol
+BASE_DELAY = 3          # Seconds between request starts within an exchange
 EXCHANGE_DELAY = 5      # When switching exchanges
 ERROR_BACKOFF = 10      # After any error
 MAX_RETRIES = 2
+SYMBOL_WORKERS = 3      # Symbols of one exchange fetched concurrently
+FRESH_HOURS = 20        # Skip symbols whose last daily bar is younger than this (--force overrides)
+
+# Run log: one JSON object per line, appended each run
+LOG_FILE = Path('historical_data/tradingview_update_log.jsonl')
+LOG_KEEP_ENTRIES = 30
+LOG_TRIM_BYTES = 1024 * 1024  # Rewrite down to the last LOG_KEEP_ENTRIES past this size
 
 # Symbol mappings (all 27 metrics)
 SYMBOLS = {
@@ -103,14 +118,56 @@ SYMBOLS = {
 }
 
 
+class RequestSpacer:
+    """Thread-safe pacing: each wait() returns at least `interval` seconds after the previous one."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# Idle logged-in TvDatafeed clients. A client keeps per-request connection
+# state, so each worker checks one out instead of sharing a single instance;
+# at most SYMBOL_WORKERS logins happen per run instead of one per symbol.
+# HTTP is only used for that login; bars come over a websocket that
+# tvDatafeed opens and closes inside each get_hist call
+_tv_clients = []
+_tv_clients_lock = threading.Lock()
+
+
+def acquire_tv():
+    """Check out an idle TradingView client, logging in a new one if none is free."""
+    with _tv_clients_lock:
+        if _tv_clients:
+            return _tv_clients.pop()
+
+    if TV_USERNAME and TV_PASSWORD:
+        return TvDatafeed(username=TV_USERNAME, password=TV_PASSWORD)
+
+    print(f"  WARNING: No login credentials (some data may be limited)")
+    return TvDatafeed()
+
+
+def release_tv(tv):
+    """Return a client after a successful request so later symbols reuse its session."""
+    with _tv_clients_lock:
+        _tv_clients.append(tv)
+
+
 def get_last_data_timestamp(filename):
     """Get the timestamp of the last data point in file."""
     try:
-        data = load_historical_data(filename)
-        if data and len(data) > 0:
-            last_ts = data[-1][0]  # milliseconds
-            return last_ts
-        return None
+        # Only the file tail is read; no full JSON parse
+        return get_last_timestamp_fast(filename)  # milliseconds
     except Exception as e:
         print(f"  Warning: Could not read {filename}: {e}")
         return None
@@ -131,33 +188,28 @@ def fetch_symbol_update(exchange, symbol, filename, n_bars=7, retry_count=0):
         dict: {'success': bool, 'new_points': int, 'error': str}
     """
     try:
-        # Initialize with login
-        if TV_USERNAME and TV_PASSWORD:
-            tv = TvDatafeed(username=TV_USERNAME, password=TV_PASSWORD)
-        else:
-            tv = TvDatafeed()
-            print(f"  WARNING: No login credentials (some data may be limited)")
-
-        # Fetch data
+        # Fetch data. A client whose request raised is not handed back, so a
+        # retry after a lost session logs in again
+        tv = acquire_tv()
         df = tv.get_hist(
             symbol=symbol,
             exchange=exchange,
             interval=Interval.in_daily,
             n_bars=n_bars
         )
+        release_tv(tv)
 
         if df is None or df.empty:
             return {'success': False, 'new_points': 0, 'error': 'No data returned'}
 
-        # Convert to standard format
-        data = []
-        for idx, row in df.iterrows():
-            timestamp_ms = int(idx.timestamp() * 1000)
-            value = float(row['close'])
-            data.append([timestamp_ms, value])
+        # Convert to standard format: whole-column extraction instead of
+        # per-row Series. Index values are UTC datetime64 (naive = UTC, as
+        # Timestamp.timestamp() treats it) at whatever unit pandas picked
+        timestamps_ms = df.index.values.astype('datetime64[ms]').astype(np.int64)
+        values = df['close'].to_numpy(dtype=np.float64)
 
-        # Standardize timestamps to midnight UTC
-        cleaned_data = standardize_to_daily_utc(data)
+        # Standardize timestamps to midnight UTC (array input, no per-row boxing)
+        cleaned_data = standardize_to_daily_utc(np.column_stack([timestamps_ms, values]))
 
         if not cleaned_data:
             return {'success': False, 'new_points': 0, 'error': 'No valid data after cleaning'}
@@ -165,19 +217,18 @@ def fetch_symbol_update(exchange, symbol, filename, n_bars=7, retry_count=0):
         # Load existing data for merging
         existing_data = load_historical_data(filename)
 
-        # Merge new data with existing historical data (prevents data loss)
-        merged_data = merge_and_deduplicate(existing_data, cleaned_data, overlap_days=3)
-
-        # Count new points added
-        existing_timestamps = set(point[0] for point in existing_data) if existing_data else set()
-        new_points = [point for point in cleaned_data if point[0] not in existing_timestamps]
+        # Merge new data with existing historical data (prevents data loss),
+        # counting timestamps that were not stored yet
+        merged_data, new_points = merge_and_deduplicate(
+            existing_data, cleaned_data, overlap_days=3, return_added=True
+        )
 
         # Save merged dataset (not just new data)
         save_historical_data(filename, merged_data)
 
         return {
             'success': True,
-            'new_points': len(new_points),
+            'new_points': new_points,
             'total_points': len(merged_data),
             'error': None
         }
@@ -195,6 +246,82 @@ def fetch_symbol_update(exchange, symbol, filename, n_bars=7, retry_count=0):
         return {'success': False, 'new_points': 0, 'error': error_msg}
 
 
+def append_log_entry(entry):
+    """
+    Append one run to the JSON Lines log without re-reading its history.
+    Once the file grows past LOG_TRIM_BYTES it is trimmed to the last
+    LOG_KEEP_ENTRIES runs through a temp file + os.replace().
+    """
+    line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    with open(LOG_FILE, 'ab') as f:
+        f.write(line)
+        size = f.tell()
+
+    if size > LOG_TRIM_BYTES:
+        with open(LOG_FILE, 'rb') as f:
+            recent = deque(f, maxlen=LOG_KEEP_ENTRIES)
+        tmp = LOG_FILE.with_name(LOG_FILE.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.writelines(recent)
+        os.replace(tmp, LOG_FILE)
+
+
+def update_symbol(exchange, symbol, filename, position, total_symbols, args, spacer, run_start):
+    """
+    Update one symbol and print its report as a single block.
+    Data age is measured against run_start (the run's UTC start time).
+
+    Returns:
+        tuple: (results category, entry) for the run summary
+    """
+    lines = [f"\n[{position}/{total_symbols}] {exchange}:{symbol}"]
+
+    # Get last data timestamp
+    last_ts = get_last_data_timestamp(filename)
+    if last_ts:
+        last_date = datetime.fromtimestamp(last_ts / 1000, tz=timezone.utc)
+        age_hours = (run_start - last_date).total_seconds() / 3600
+        lines.append(f"  Last data: {last_date.strftime('%Y-%m-%d %H:%M UTC')} ({age_hours:.1f}h ago)")
+    else:
+        lines.append(f"  No existing data found")
+
+    # Fetch update
+    if last_ts and age_hours < FRESH_HOURS and not args.force:
+        # Today's daily bar is already stored; a fetch would add nothing
+        lines.append(f"  [SKIP FRESH] Last bar is under {FRESH_HOURS}h old (use --force to fetch anyway)")
+        category, entry = 'no_new_data', f"{exchange}:{symbol}"
+    elif args.dry_run:
+        lines.append(f"  [DRY-RUN] Would fetch last {args.days} days")
+        category, entry = 'updated', {
+            'symbol': f"{exchange}:{symbol}",
+            'new_points': 0,
+            'dry_run': True
+        }
+    else:
+        spacer.wait()
+        result = fetch_symbol_update(exchange, symbol, filename, n_bars=args.days)
+
+        if result['success']:
+            if result['new_points'] > 0:
+                lines.append(f"  [SUCCESS] Added {result['new_points']} new points (fetched {result['total_points']})")
+                category, entry = 'updated', {
+                    'symbol': f"{exchange}:{symbol}",
+                    'new_points': result['new_points']
+                }
+            else:
+                lines.append(f"  [UP-TO-DATE] No new data (fetched {result['total_points']}, all existed)")
+                category, entry = 'no_new_data', f"{exchange}:{symbol}"
+        else:
+            lines.append(f"  [FAILED] {result['error']}")
+            category, entry = 'failed', {
+                'symbol': f"{exchange}:{symbol}",
+                'error': result['error']
+            }
+
+    print('\n'.join(lines))
+    return category, entry
+
+
 def main():
     """Main execution."""
     parser = argparse.ArgumentParser(description='TradingView Daily Updater')
@@ -204,7 +331,10 @@ def main():
                        help='Test mode - show what would be updated without saving')
     parser.add_argument('--symbols', type=int,
                        help='Only update first N symbols (for testing)')
+    parser.add_argument('--force', action='store_true',
+                       help=f'Fetch even symbols updated within the last {FRESH_HOURS}h')
     args = parser.parse_args()
+    run_start = datetime.now(tz=timezone.utc)
 
     print("="*80)
     print("TRADINGVIEW DAILY UPDATER")
@@ -214,10 +344,15 @@ def main():
     print(f"Fetch period: Last {args.days} days")
     print(f"Mode: {'DRY-RUN (no saves)' if args.dry_run else 'LIVE UPDATE'}")
 
-    # Count total symbols
-    total_symbols = sum(len(symbols) for symbols in SYMBOLS.values())
+    # Flat, numbered work list; --symbols is just a slice of it
+    jobs = list(enumerate(
+        ((exchange, symbol, filename)
+         for exchange, symbol_list in SYMBOLS.items()
+         for symbol, filename in symbol_list),
+        start=1
+    ))[:args.symbols or None]
+    total_symbols = len(jobs)
     if args.symbols:
-        total_symbols = min(args.symbols, total_symbols)
         print(f"Test mode: Only updating first {total_symbols} symbols")
 
     print(f"Symbols to update: {total_symbols}")
@@ -236,81 +371,36 @@ def main():
         'failed': []
     }
 
-    symbol_count = 0
-    last_exchange = None
+    for batch_index, (exchange, group) in enumerate(groupby(jobs, key=lambda job: job[1][0])):
+        group = list(group)
 
-    for exchange, symbol_list in SYMBOLS.items():
         # Add delay when switching exchanges
-        if last_exchange and last_exchange != exchange:
+        if batch_index > 0:
             print(f"\n[Switching to {exchange}] Waiting {EXCHANGE_DELAY}s...")
             time.sleep(EXCHANGE_DELAY)
 
         print(f"\n{'='*80}")
-        print(f"EXCHANGE: {exchange} ({len(symbol_list)} symbols)")
+        print(f"EXCHANGE: {exchange} ({len(group)} symbols)")
         print(f"{'='*80}")
 
-        for symbol, filename in symbol_list:
-            symbol_count += 1
-
-            # Check if we should stop (for --symbols limit)
-            if args.symbols and symbol_count > args.symbols:
-                print(f"\nReached symbol limit ({args.symbols}), stopping.")
-                break
-
-            print(f"\n[{symbol_count}/{total_symbols}] {exchange}:{symbol}")
+        # Requests are I/O bound: overlap a few symbols of the same exchange,
+        # spacing request starts by BASE_DELAY to respect its rate limit
+        spacer = RequestSpacer(BASE_DELAY)
 
-            # Get last data timestamp
-            last_ts = get_last_data_timestamp(filename)
-            if last_ts:
-                last_date = datetime.fromtimestamp(last_ts / 1000, tz=timezone.utc)
-                age_hours = (datetime.now(tz=timezone.utc) - last_date).total_seconds() / 3600
-                print(f"  Last data: {last_date.strftime('%Y-%m-%d %H:%M UTC')} ({age_hours:.1f}h ago)")
-            else:
-                print(f"  No existing data found")
+        def run(job):
+            position, (exchange, symbol, filename) = job
+            return update_symbol(exchange, symbol, filename, position,
+                                 total_symbols, args, spacer, run_start)
 
-            # Fetch update
-            if args.dry_run:
-                print(f"  [DRY-RUN] Would fetch last {args.days} days")
-                results['updated'].append({
-                    'symbol': f"{exchange}:{symbol}",
-                    'new_points': 0,
-                    'dry_run': True
-                })
-            else:
-                result = fetch_symbol_update(exchange, symbol, filename, n_bars=args.days)
-
-                if result['success']:
-                    if result['new_points'] > 0:
-                        print(f"  [SUCCESS] Added {result['new_points']} new points (fetched {result['total_points']})")
-                        results['updated'].append({
-                            'symbol': f"{exchange}:{symbol}",
-                            'new_points': result['new_points']
-                        })
-                    else:
-                        print(f"  [UP-TO-DATE] No new data (fetched {result['total_points']}, all existed)")
-                        results['no_new_data'].append(f"{exchange}:{symbol}")
-                else:
-                    print(f"  [FAILED] {result['error']}")
-                    results['failed'].append({
-                        'symbol': f"{exchange}:{symbol}",
-                        'error': result['error']
-                    })
-
-            # Delay between symbols
-            if symbol_count < total_symbols:
-                time.sleep(BASE_DELAY)
-
-        last_exchange = exchange
-
-        # Break outer loop if reached symbol limit
-        if args.symbols and symbol_count >= args.symbols:
-            break
+        with ThreadPoolExecutor(max_workers=min(SYMBOL_WORKERS, len(group))) as executor:
+            for category, entry in executor.map(run, group):
+                results[category].append(entry)
 
     # Final summary
     print("\n\n" + "="*80)
     print("UPDATE SUMMARY")
     print("="*80)
-    print(f"Total symbols processed: {symbol_count}")
+    print(f"Total symbols processed: {total_symbols}")
     print(f"Updated (new data): {len(results['updated'])}")
     print(f"Up-to-date (no new data): {len(results['no_new_data'])}")
     print(f"Failed: {len(results['failed'])}")
@@ -339,7 +429,6 @@ def main():
 
     # Save results to log file
     if not args.dry_run:
-        log_file = Path('historical_data/tradingview_update_log.json')
         log_entry = {
             'timestamp': datetime.now(tz=timezone.utc).isoformat(),
             'updated': len(results['updated']),
@@ -348,23 +437,9 @@ def main():
             'details': results
         }
 
-        # Append to log file
         try:
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    logs = json.load(f)
-            else:
-                logs = []
-
-            logs.append(log_entry)
-
-            # Keep only last 30 entries
-            logs = logs[-30:]
-
-            with open(log_file, 'w') as f:
-                json.dump(logs, f, indent=2)
-
-            print(f"\nLog saved to: {log_file}")
+            append_log_entry(log_entry)
+            print(f"\nLog saved to: {LOG_FILE}")
         except Exception as e:
             print(f"\nWarning: Could not save log: {e}")
 
@@ -24,11 +24,12 @@ Interpretation:
 """
 
 import numpy as np
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from .numba_utils import njit, NUMBA_AVAILABLE
 from .incremental_data_manager import (
     load_historical_data,
     save_historical_data,
-    merge_and_deduplicate,
     validate_data_structure
 )
 
@@ -60,137 +61,192 @@ def get_metadata(asset='btc'):
     }
 
 
+@njit(cache=True)
 def wilder_smooth(values, period):
     """
     Apply Wilder's smoothing (modified EMA).
 
     Formula: smooth[t] = (smooth[t-1] * (period - 1) + value[t]) / period
+             (evaluated as smooth[t-1] * decay + value[t] * alpha)
 
     Args:
-        values (list): List of values to smooth
+        values (np.ndarray): float64 values to smooth
         period (int): Smoothing period
 
     Returns:
-        list: Smoothed values (first 'period' values will be None, then SMA, then Wilder smooth)
+        np.ndarray: Smoothed values (first 'period - 1' values are NaN, then SMA, then Wilder smooth)
     """
-    if len(values) < period:
-        return [None] * len(values)
-
-    smoothed = [None] * (period - 1)
+    n = values.shape[0]
+    smoothed = np.full(n, np.nan)
+    if n < period:
+        return smoothed
 
     # First smoothed value is simple average
-    first_smooth = np.mean(values[:period])
-    smoothed.append(first_smooth)
-
-    # Subsequent values use Wilder's smoothing
-    for i in range(period, len(values)):
-        smooth = (smoothed[-1] * (period - 1) + values[i]) / period
-        smoothed.append(smooth)
+    total = 0.0
+    for i in range(period):
+        total += values[i]
+    smooth = total / period
+    smoothed[period - 1] = smooth
+
+    # Subsequent values use Wilder's smoothing (loop-invariant coefficients,
+    # so each step is two multiplies instead of a divide)
+    decay = (period - 1) / period
+    alpha = 1.0 / period
+    for i in range(period, n):
+        smooth = smooth * decay + values[i] * alpha
+        smoothed[i] = smooth
 
     return smoothed
 
 
-def calculate_adx(high, low, close, period=14):
+@njit(cache=True)
+def _adx_core(high, low, close, period):
     """
-    Calculate ADX (Average Directional Index).
+    Fused single-pass ADX kernel (compiled with Numba): +DM/-DM/TR, their
+    Wilder smoothing, +DI/-DI, DX and the Wilder smoothing of DX are all
+    carried as running scalars. Same results as _adx_vectorized.
+    """
+    n = high.shape[0]
+    adx = np.full(n, np.nan)
+
+    decay = (period - 1) / period
+    alpha = 1.0 / period
+    sum_plus_dm = 0.0
+    sum_minus_dm = 0.0
+    sum_tr = 0.0
+    dx_count = 0
+    dx_sum = 0.0
+    adx_value = 0.0
+
+    for i in range(1, n):
+        # Directional movements and True Range of bar i
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+
+        # Wilder smoothing: SMA seed over the first `period` moves, then recurrence
+        if i <= period:
+            sum_plus_dm += plus_dm
+            sum_minus_dm += minus_dm
+            sum_tr += tr
+            if i < period:
+                continue
+            smooth_plus_dm = sum_plus_dm / period
+            smooth_minus_dm = sum_minus_dm / period
+            smooth_tr = sum_tr / period
+        else:
+            smooth_plus_dm = smooth_plus_dm * decay + plus_dm * alpha
+            smooth_minus_dm = smooth_minus_dm * decay + minus_dm * alpha
+            smooth_tr = smooth_tr * decay + tr * alpha
+
+        # +DI/-DI and DX (undefined when ATR or the DI sum is zero)
+        if not smooth_tr > 0:
+            continue
+        plus_di = (smooth_plus_dm / smooth_tr) * 100
+        minus_di = (smooth_minus_dm / smooth_tr) * 100
+        di_sum = plus_di + minus_di
+        if not di_sum > 0:
+            continue
+        dx = (abs(plus_di - minus_di) / di_sum) * 100
+
+        # Wilder smoothing over the defined DX values only
+        dx_count += 1
+        if dx_count < period:
+            dx_sum += dx
+            continue
+        if dx_count == period:
+            adx_value = (dx_sum + dx) / period
+        else:
+            adx_value = adx_value * decay + dx * alpha
+        adx[i] = adx_value
+
+    return adx
+
+
+def adx_array(high, low, close, period=14):
+    """
+    Calculate ADX as a float64 array aligned with the input bars.
+
+    Uses the fused Numba kernel when Numba is installed, else the NumPy
+    array implementation.
 
     Args:
-        high (list): List of high prices
-        low (list): List of low prices
-        close (list): List of closing prices
+        high, low, close (array-like): OHLC price columns
         period (int): ADX period (default: 14)
 
     Returns:
-        list: ADX values (first period*2-1 values will be None)
+        np.ndarray: ADX values (NaN where not yet defined)
     """
-    if len(high) < period + 1 or len(low) < period + 1 or len(close) < period + 1:
-        return [None] * len(high)
-
-    n = len(high)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
 
-    # Step 1: Calculate directional movements (+DM, -DM) and True Range
-    plus_dm = []
-    minus_dm = []
-    true_range = []
+    if len(high) < period + 1 or len(low) < period + 1 or len(close) < period + 1:
+        return np.full(len(high), np.nan)
 
-    for i in range(1, n):
-        # Directional movements
-        up_move = high[i] - high[i-1]
-        down_move = low[i-1] - low[i]
+    if NUMBA_AVAILABLE:
+        return _adx_core(high, low, close, period)
+    return _adx_vectorized(high, low, close, period)
 
-        # +DM: upward movement if greater than downward movement, else 0
-        if up_move > down_move and up_move > 0:
-            plus_dm.append(up_move)
-        else:
-            plus_dm.append(0)
 
-        # -DM: downward movement if greater than upward movement, else 0
-        if down_move > up_move and down_move > 0:
-            minus_dm.append(down_move)
-        else:
-            minus_dm.append(0)
-
-        # True Range
-        tr = max(
-            high[i] - low[i],
-            abs(high[i] - close[i-1]),
-            abs(low[i] - close[i-1])
-        )
-        true_range.append(tr)
+def _adx_vectorized(high, low, close, period):
+    """ADX from whole-array NumPy expressions (fallback without Numba)."""
+    n = len(high)
+    adx = np.full(n, np.nan)
+
+    # Step 1: Directional movements (+DM, -DM) and True Range for bars 1..n-1
+    up_move = high[1:] - high[:-1]
+    down_move = low[:-1] - low[1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+    true_range = np.maximum(
+        high[1:] - low[1:],
+        np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1]))
+    )
 
     # Step 2: Smooth +DM, -DM, and TR using Wilder's smoothing
     smooth_plus_dm = wilder_smooth(plus_dm, period)
     smooth_minus_dm = wilder_smooth(minus_dm, period)
     smooth_tr = wilder_smooth(true_range, period)  # This is ATR
 
-    # Step 3: Calculate +DI and -DI
-    plus_di = []
-    minus_di = []
-
-    for i in range(len(smooth_tr)):
-        if smooth_tr[i] is not None and smooth_tr[i] > 0:
-            plus_di.append((smooth_plus_dm[i] / smooth_tr[i]) * 100)
-            minus_di.append((smooth_minus_dm[i] / smooth_tr[i]) * 100)
-        else:
-            plus_di.append(None)
-            minus_di.append(None)
-
-    # Step 4: Calculate DX (Directional Index)
-    dx = []
-
-    for i in range(len(plus_di)):
-        if plus_di[i] is not None and minus_di[i] is not None:
-            di_sum = plus_di[i] + minus_di[i]
-            if di_sum > 0:
-                dx_value = (abs(plus_di[i] - minus_di[i]) / di_sum) * 100
-                dx.append(dx_value)
-            else:
-                dx.append(None)
-        else:
-            dx.append(None)
+    # Step 3: +DI and -DI (undefined while ATR is NaN or zero)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        has_tr = smooth_tr > 0
+        plus_di = np.where(has_tr, smooth_plus_dm / smooth_tr * 100, np.nan)
+        minus_di = np.where(has_tr, smooth_minus_dm / smooth_tr * 100, np.nan)
 
-    # Step 5: Smooth DX to get ADX
-    # Extract non-None DX values for smoothing
-    dx_values_clean = [v for v in dx if v is not None]
+        # Step 4: DX (undefined when both DIs are zero)
+        di_sum = plus_di + minus_di
+        dx = np.where(di_sum > 0, np.abs(plus_di - minus_di) / di_sum * 100, np.nan)
 
+    # Step 5: Smooth the defined DX values to get ADX, then map them back
+    # onto the bar timeline (bar 0 has no DM/TR)
+    has_dx = ~np.isnan(dx)
+    dx_values_clean = dx[has_dx]
     if len(dx_values_clean) < period:
         # Not enough data for ADX
-        return [None] * n
+        return adx
 
-    adx_smooth = wilder_smooth(dx_values_clean, period)
+    adx[1:][has_dx] = wilder_smooth(dx_values_clean, period)
+    return adx
 
-    # Map ADX back to original timeline (accounting for initial None at start)
-    adx = [None] * (n - len(dx))  # Account for first bar not having DM/TR
 
-    adx_idx = 0
-    for i in range(len(dx)):
-        if dx[i] is not None:
-            adx.append(adx_smooth[adx_idx])
-            adx_idx += 1
-        else:
-            adx.append(None)
+def calculate_adx(high, low, close, period=14):
+    """
+    Calculate ADX (Average Directional Index).
 
-    return adx
+    Args:
+        high (list): List of high prices
+        low (list): List of low prices
+        close (list): List of closing prices
+        period (int): ADX period (default: 14)
+
+    Returns:
+        list: ADX values (first period*2-1 values will be None)
+    """
+    return [None if np.isnan(v) else v for v in adx_array(high, low, close, period).tolist()]
 
 
 def calculate_adx_from_ohlcv(ohlcv_data, period=14):
@@ -207,24 +263,16 @@ def calculate_adx_from_ohlcv(ohlcv_data, period=14):
     if not ohlcv_data or len(ohlcv_data) < period * 2:
         return []
 
-    # Extract OHLC components
-    high = [item[2] for item in ohlcv_data]
-    low = [item[3] for item in ohlcv_data]
-    close = [item[4] for item in ohlcv_data]
+    # One conversion of the row list into a 2-D array; columns are views
+    rows = np.asarray(ohlcv_data, dtype=np.float64)
+    timestamps = rows[:, 0].astype(np.int64)
 
     # Calculate ADX
-    adx_values = calculate_adx(high, low, close, period)
-
-    # Pair timestamps with ADX values, skip None values
-    result = []
-    for i, item in enumerate(ohlcv_data):
-        timestamp = item[0]
-        adx_value = adx_values[i]
-
-        if adx_value is not None:
-            result.append([timestamp, adx_value])
+    adx_values = adx_array(rows[:, 2], rows[:, 3], rows[:, 4], period)
 
-    return result
+    # Pair timestamps with ADX values, skip undefined values
+    defined = ~np.isnan(adx_values)
+    return [list(pair) for pair in zip(timestamps[defined].tolist(), adx_values[defined].tolist())]
 
 
 def get_data(days='365', asset='btc', period=14):
@@ -283,12 +331,12 @@ def get_data(days='365', asset='btc', period=14):
 
         print(f"[ADX {asset.upper()}] Calculated {len(calculated_adx)} ADX values")
 
-        # Merge with historical data
-        merged_data = merge_and_deduplicate(
-            existing_data=historical_data,
-            new_data=calculated_adx,
-            overlap_days=fetch_days
-        )
+        # Merge with historical data. Both series are sorted and the
+        # recalculated window supersedes stored values it overlaps, so keep
+        # the stored history before its first bar and append it as-is
+        first_new_ts = calculated_adx[0][0]
+        keep = bisect_left(historical_data, first_new_ts, key=lambda record: record[0])
+        merged_data = historical_data[:keep] + calculated_adx
 
         # Validate data structure
         is_valid, structure_type, error_msg = validate_data_structure(merged_data)
@@ -302,7 +350,8 @@ def get_data(days='365', asset='btc', period=14):
         if days != 'max':
             cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=int(days))
             cutoff_ms = int(cutoff_date.timestamp() * 1000)
-            filtered_data = [d for d in merged_data if d[0] >= cutoff_ms]
+            # Sorted by timestamp: binary-search the cut point
+            filtered_data = merged_data[bisect_left(merged_data, cutoff_ms, key=lambda d: d[0]):]
         else:
             filtered_data = merged_data
 
@@ -330,7 +379,7 @@ def get_data(days='365', asset='btc', period=14):
             if days != 'max':
                 cutoff_date = datetime.now(tz=timezone.utc) - timedelta(days=int(days))
                 cutoff_ms = int(cutoff_date.timestamp() * 1000)
-                filtered_data = [d for d in historical_data if d[0] >= cutoff_ms]
+                filtered_data = historical_data[bisect_left(historical_data, cutoff_ms, key=lambda d: d[0]):]
             else:
                 filtered_data = historical_data
 
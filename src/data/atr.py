@@ -18,18 +18,30 @@ Interpretation:
 - Use ATR% (ATR/Price) for cross-asset comparisons
 """
 
+import time
 import numpy as np
+from functools import lru_cache
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from .numba_utils import njit, NUMBA_AVAILABLE
 from .incremental_data_manager import (
     load_historical_data,
     save_historical_data,
-    merge_and_deduplicate,
     validate_data_structure
 )
 
+DEFAULT_PERIOD = 14
+MS_PER_DAY = 24 * 60 * 60 * 1000
 
+# Requests within this many seconds of a recalculation reuse the stored series
+# instead of refetching prices (dataset name -> time.monotonic() of last run)
+RECALC_INTERVAL_SECONDS = 15 * 60
+_last_recalculated = {}
+
+
+@lru_cache(maxsize=16)
 def get_metadata(asset='btc'):
-    """Returns metadata describing how this data should be displayed"""
+    """Returns metadata describing how this data should be displayed (cached per asset; do not mutate)"""
     asset_names = {
         'btc': 'Bitcoin',
         'eth': 'Ethereum',
@@ -52,34 +64,130 @@ def get_metadata(asset='btc'):
     }
 
 
-def wilder_smooth(values, period):
+def _wilder_smooth_convolved(values, period):
+    """
+    Apply Wilder's smoothing (modified EMA) without a sequential loop.
+
+    Formula: smooth[t] = (smooth[t-1] * (period - 1) + value[t]) / period,
+    seeded with the simple average of the first 'period' values (earlier
+    values are NaN). Used by the NumPy fallback when Numba is unavailable;
+    _atr_core runs the same recurrence as a compiled loop.
+
+    After the SMA seed the recurrence is a geometric moving average:
+    smooth[t] = decay**k * seed + alpha * sum(decay**j * values[t - j], j < k),
+    with k bars since the seed, alpha = 1/period and decay = (period-1)/period.
+    The sum is one np.convolve with the weights alpha * decay**j, truncated
+    where decay**j drops below float64 epsilon (about 500 taps for period 14),
+    so results match the recurrence to rounding. A NaN input leaves the rest
+    of the series NaN, as it does in the recurrence.
+    """
+    n = len(values)
+    smoothed = np.full(n, np.nan)
+    if n < period:
+        return smoothed
+
+    # First smoothed value is simple average
+    seed = values[:period].mean()
+    smoothed[period - 1] = seed
+
+    tail = values[period:]
+    if not len(tail):
+        return smoothed
+
+    alpha = 1.0 / period
+    decay = (period - 1) / period
+    taps = 1 if decay == 0 else int(np.ceil(np.log(np.finfo(np.float64).eps) / np.log(decay))) + 1
+    weights = alpha * decay ** np.arange(min(taps, len(tail)))
+
+    smoothed[period:] = (
+        np.convolve(tail, weights)[:len(tail)]
+        + seed * decay ** np.arange(1, len(tail) + 1)
+    )
+
+    missing = np.isnan(tail)
+    if missing.any():
+        smoothed[period + int(np.argmax(missing)):] = np.nan
+
+    return smoothed
+
+
+@njit(cache=True)
+def _atr_core(high, low, close, period):
+    """
+    Fused single-pass ATR kernel (compiled with Numba): True Range and its
+    Wilder smoothing are carried as running scalars. Same results as
+    _atr_vectorized (to rounding).
+    """
+    n = high.shape[0]
+    atr = np.full(n, np.nan)
+
+    tr_sum = 0.0
+    smooth = 0.0
+
+    for i in range(1, n):
+        # True Range of bar i: max(High - Low, |High - Prev Close|, |Low - Prev Close|)
+        # (NaN if any term is NaN, like np.maximum; the builtin max skips NaN
+        # unless it comes first)
+        high_low = high[i] - low[i]
+        high_close = abs(high[i] - close[i - 1])
+        low_close = abs(low[i] - close[i - 1])
+        if np.isnan(high_close) or np.isnan(low_close):
+            tr = np.nan
+        else:
+            tr = max(high_low, high_close, low_close)
+
+        # Wilder smoothing: SMA seed over the first `period` ranges, then recurrence
+        if i <= period:
+            tr_sum += tr
+            if i < period:
+                continue
+            smooth = tr_sum / period
+        else:
+            smooth = (smooth * (period - 1) + tr) / period
+        atr[i] = smooth
+
+    return atr
+
+
+def atr_array(high, low, close, period=14):
     """
-    Apply Wilder's smoothing (modified EMA).
+    Calculate ATR as a float64 array aligned with the input bars.
 
-    Formula: smooth[t] = (smooth[t-1] * (period - 1) + value[t]) / period
+    Uses the fused Numba kernel when Numba is installed, else the NumPy
+    array implementation.
 
     Args:
-        values (list): List of values to smooth
-        period (int): Smoothing period
+        high, low, close (array-like): OHLC price columns
+        period (int): ATR period (default: 14)
 
     Returns:
-        list: Smoothed values (first 'period' values will be None, then SMA, then Wilder smooth)
+        np.ndarray: ATR values (NaN where not yet defined)
     """
-    if len(values) < period:
-        return [None] * len(values)
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
 
-    smoothed = [None] * (period - 1)
+    if len(high) < period + 1 or len(low) < period + 1 or len(close) < period + 1:
+        return np.full(len(high), np.nan)
 
-    # First smoothed value is simple average
-    first_smooth = np.mean(values[:period])
-    smoothed.append(first_smooth)
+    if NUMBA_AVAILABLE:
+        return _atr_core(high, low, close, period)
+    return _atr_vectorized(high, low, close, period)
 
-    # Subsequent values use Wilder's smoothing
-    for i in range(period, len(values)):
-        smooth = (smoothed[-1] * (period - 1) + values[i]) / period
-        smoothed.append(smooth)
 
-    return smoothed
+def _atr_vectorized(high, low, close, period):
+    """ATR from whole-array NumPy expressions (fallback without Numba)."""
+    atr = np.full(len(high), np.nan)
+
+    # True Range for bars 1..n-1: max(High - Low, |High - Prev Close|, |Low - Prev Close|)
+    true_range = np.maximum(
+        high[1:] - low[1:],
+        np.maximum(np.abs(high[1:] - close[:-1]), np.abs(low[1:] - close[:-1]))
+    )
+
+    # Apply Wilder's smoothing to get ATR (bar 0 has no TR)
+    atr[1:] = _wilder_smooth_convolved(true_range, period)
+    return atr
 
 
 def calculate_atr(high, low, close, period=14):
@@ -95,28 +203,9 @@ def calculate_atr(high, low, close, period=14):
     Returns:
         list: ATR values (first period values will be None)
     """
-    if len(high) < period + 1 or len(low) < period + 1 or len(close) < period + 1:
-        return [None] * len(high)
-
-    n = len(high)
-    true_range = []
-
-    # Calculate True Range for each bar (starting from index 1)
-    for i in range(1, n):
-        tr = max(
-            high[i] - low[i],                # High - Low
-            abs(high[i] - close[i-1]),       # |High - Previous Close|
-            abs(low[i] - close[i-1])         # |Low - Previous Close|
-        )
-        true_range.append(tr)
-
-    # Apply Wilder's smoothing to get ATR
-    atr_smooth = wilder_smooth(true_range, period)
-
-    # Add initial None to account for first bar not having TR
-    atr = [None] + atr_smooth
-
-    return atr
+    # Only the warm-up prefix is None; a NaN later on (a price gap) stays NaN
+    atr_values = atr_array(high, low, close, period).tolist()
+    return [None] * min(period, len(atr_values)) + atr_values[period:]
 
 
 def calculate_atr_from_ohlcv(ohlcv_data, period=14):
@@ -128,32 +217,106 @@ def calculate_atr_from_ohlcv(ohlcv_data, period=14):
         period (int): ATR period (default: 14)
 
     Returns:
-        list: [[timestamp, atr_value], ...] (skips None values)
+        list: [[timestamp, atr_value], ...] (skips the first 'period' warm-up bars;
+              bars after a price gap are kept with NaN values)
     """
     if not ohlcv_data or len(ohlcv_data) < period + 1:
         return []
 
-    # Extract OHLC components
-    high = [item[2] for item in ohlcv_data]
-    low = [item[3] for item in ohlcv_data]
-    close = [item[4] for item in ohlcv_data]
+    # One conversion of the row list into a 2-D array; columns are views
+    rows = np.asarray(ohlcv_data, dtype=np.float64)
+    timestamps = rows[:, 0].astype(np.int64)
 
     # Calculate ATR
-    atr_values = calculate_atr(high, low, close, period)
+    atr_values = atr_array(rows[:, 2], rows[:, 3], rows[:, 4], period)
+
+    # Pair timestamps with ATR values, skipping only the warm-up bars so the
+    # output stays aligned with the price timeline across gaps
+    return [list(pair) for pair in zip(timestamps[period:].tolist(), atr_values[period:].tolist())]
+
+
+def _is_fresh(historical_data, dataset_name, days, period):
+    """
+    True if the stored ATR series can answer the request without recalculating.
+
+    The series must end at the current daily bar, have been recalculated by
+    this process within RECALC_INTERVAL_SECONDS (the current bar keeps moving
+    until the day closes), and reach back over the requested window. 'max'
+    always recalculates, because the stored series only spans windows
+    requested before, and so does any non-default period, because the cache
+    holds the default-period series.
+    """
+    if not historical_data or days == 'max' or period != DEFAULT_PERIOD:
+        return False
+
+    recalculated_at = _last_recalculated.get(dataset_name)
+    if recalculated_at is None or time.monotonic() - recalculated_at >= RECALC_INTERVAL_SECONDS:
+        return False
+
+    last_timestamp = historical_data[-1][0]
+    if time.time() * 1000 - last_timestamp >= MS_PER_DAY:
+        return False
+
+    return historical_data[0][0] <= last_timestamp - int(days) * MS_PER_DAY
+
+
+def _recalculate(historical_data, dataset_name, days, asset, period):
+    """Fetch prices, recalculate ATR, merge it into the stored series and save it."""
+    # Determine required price data days
+    # Need extra days for ATR calculation (period + buffer)
+    if days == 'max':
+        price_days = 'max'
+    else:
+        price_days = str(int(days) + period + 10)
+
+    # Import asset price module dynamically
+    if asset == 'btc':
+        from . import btc_price
+        price_module = btc_price
+    elif asset == 'eth':
+        from . import eth_price
+        price_module = eth_price
+    elif asset == 'gold':
+        from . import gold_price
+        price_module = gold_price
+    else:
+        raise ValueError(f"Unknown asset: {asset}")
 
-    # Pair timestamps with ATR values, skip None values
-    result = []
-    for i, item in enumerate(ohlcv_data):
-        timestamp = item[0]
-        atr_value = atr_values[i]
+    print(f"[ATR {asset.upper()}] Fetching {asset.upper()} price data for ATR calculation...")
+    price_result = price_module.get_data(price_days)
+    ohlcv_data = price_result['data']
 
-        if atr_value is not None:
-            result.append([timestamp, atr_value])
+    if not ohlcv_data:
+        raise ValueError(f"No {asset.upper()} price data available")
 
-    return result
+    print(f"[ATR {asset.upper()}] Calculating ATR from {len(ohlcv_data)} price data points...")
 
+    # Calculate ATR from OHLCV data
+    new_atr_data = calculate_atr_from_ohlcv(ohlcv_data, period)
 
-def get_data(days='365', asset='btc', period=14):
+    if not new_atr_data:
+        raise ValueError("ATR calculation failed")
+
+    print(f"[ATR {asset.upper()}] Calculated {len(new_atr_data)} ATR values")
+
+    # Merge with historical data. Both series are sorted and the
+    # recalculated window supersedes stored values it overlaps, so keep
+    # the stored history before its first bar and append it as-is
+    keep = bisect_left(historical_data, new_atr_data[0][0], key=lambda record: record[0])
+    merged_data = historical_data[:keep] + new_atr_data
+
+    # Validate and save
+    is_valid, structure_type, error_msg = validate_data_structure(merged_data)
+    if not is_valid:
+        raise ValueError(f"Invalid data structure: {error_msg}")
+    save_historical_data(dataset_name, merged_data)
+    if period == DEFAULT_PERIOD:
+        _last_recalculated[dataset_name] = time.monotonic()
+
+    return merged_data
+
+
+def get_data(days='365', asset='btc', period=DEFAULT_PERIOD):
     """
     Fetches ATR data using incremental fetching strategy.
 
@@ -176,63 +339,21 @@ def get_data(days='365', asset='btc', period=14):
         # Load historical ATR data from disk
         historical_data = load_historical_data(dataset_name)
 
-        # Determine required price data days
-        # Need extra days for ATR calculation (period + buffer)
-        if days == 'max':
-            price_days = 'max'
-        else:
-            price_days = str(int(days) + period + 10)
-
-        # Import asset price module dynamically
-        if asset == 'btc':
-            from . import btc_price
-            price_module = btc_price
-        elif asset == 'eth':
-            from . import eth_price
-            price_module = eth_price
-        elif asset == 'gold':
-            from . import gold_price
-            price_module = gold_price
+        if _is_fresh(historical_data, dataset_name, days, period):
+            # Warm cache: the stored series already covers the window
+            print(f"[ATR {asset.upper()}] Using {len(historical_data)} stored ATR values (up to date)")
+            merged_data = historical_data
         else:
-            raise ValueError(f"Unknown asset: {asset}")
-
-        print(f"[ATR {asset.upper()}] Fetching {asset.upper()} price data for ATR calculation...")
-        price_result = price_module.get_data(price_days)
-        ohlcv_data = price_result['data']
-
-        if not ohlcv_data:
-            raise ValueError(f"No {asset.upper()} price data available")
-
-        print(f"[ATR {asset.upper()}] Calculating ATR from {len(ohlcv_data)} price data points...")
-
-        # Calculate ATR from OHLCV data
-        new_atr_data = calculate_atr_from_ohlcv(ohlcv_data, period)
-
-        if not new_atr_data:
-            raise ValueError("ATR calculation failed")
-
-        print(f"[ATR {asset.upper()}] Calculated {len(new_atr_data)} ATR values")
-
-        # Merge with historical data
-        # Use keyword arguments to avoid passing dataset_name as overlap_days
-        merged_data = merge_and_deduplicate(
-            existing_data=historical_data,
-            new_data=new_atr_data
-        )
-
-        # Validate and save
-        is_valid, structure_type, error_msg = validate_data_structure(merged_data)
-        if not is_valid:
-            raise ValueError(f"Invalid data structure: {error_msg}")
-        save_historical_data(dataset_name, merged_data)
+            merged_data = _recalculate(historical_data, dataset_name, days, asset, period)
 
         # Return requested number of days
         if days == 'max':
             final_data = merged_data
         else:
             days_int = int(days)
-            cutoff_timestamp = merged_data[-1][0] - (days_int * 24 * 60 * 60 * 1000)
-            final_data = [d for d in merged_data if d[0] >= cutoff_timestamp]
+            cutoff_timestamp = merged_data[-1][0] - days_int * MS_PER_DAY
+            # Sorted by timestamp: binary-search the cut point
+            final_data = merged_data[bisect_left(merged_data, cutoff_timestamp, key=lambda d: d[0]):]
 
         print(f"[ATR {asset.upper()}] Returning {len(final_data)} ATR data points")
 
@@ -240,7 +361,8 @@ def get_data(days='365', asset='btc', period=14):
             start_date = datetime.fromtimestamp(final_data[0][0] / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
             end_date = datetime.fromtimestamp(final_data[-1][0] / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
             print(f"[ATR {asset.upper()}] Date range: {start_date} to {end_date}")
-            print(f"[ATR {asset.upper()}] ATR range: {min(d[1] for d in final_data):.2f} to {max(d[1] for d in final_data):.2f}")
+            atr_values = np.fromiter((d[1] for d in final_data), dtype=np.float64, count=len(final_data))
+            print(f"[ATR {asset.upper()}] ATR range: {atr_values.min():.2f} to {atr_values.max():.2f}")
 
         return {
             'metadata': metadata,
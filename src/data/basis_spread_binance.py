@@ -7,18 +7,36 @@ Positive values indicate backwardation (spot > futures).
 Negative values indicate contango (futures > spot).
 
 Data Source: Binance Futures API (free, no API key required)
-Cache: historical_data/basis_spread_btc.json
+Cache: historical_data/basis_spread_btc.json (canonical, read by the migration
+       and inventory scripts) plus a columnar basis_spread_btc.npy copy that
+       is loaded once per process and rebuilt whenever the JSON is newer
 Update Strategy: Incremental daily updates appended to cache
 """
 
-import json
+import os
+import time
+import numpy as np
+from functools import lru_cache
+from bisect import bisect_left
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Any
 from data.binance_utils import fetch_recent_data, fetch_basis_spread
 from data.derivatives_config import CACHE_DIR, DEFAULT_SYMBOL
+from data.json_utils import parse_json, dump_json
 
+# Columnar cache layout: one int64 timestamp + one float64 value per row (null -> NaN)
+CACHE_DTYPE = np.dtype([('timestamp', '<i8'), ('value', '<f8')])
 
+MS_PER_HOUR = 60 * 60 * 1000
+
+# Loaded arrays keyed by .npy path -> (mtime_ns, read-only array). The file is
+# a few KB per year of daily rows, so it is held in memory rather than mapped
+# (a live mapping would also block replacing the file on Windows)
+_array_cache = {}
+
+
+@lru_cache(maxsize=16)
 def get_metadata(symbol: str = DEFAULT_SYMBOL) -> Dict[str, Any]:
     """
     Returns display metadata for basis spread oscillator.
@@ -27,7 +45,7 @@ def get_metadata(symbol: str = DEFAULT_SYMBOL) -> Dict[str, Any]:
         symbol: Trading pair symbol (default: BTCUSDT)
 
     Returns:
-        Metadata dictionary for frontend rendering
+        Metadata dictionary for frontend rendering (cached per symbol; do not mutate)
     """
     return {
         'label': f'{symbol} Basis Spread',
@@ -40,61 +58,124 @@ def get_metadata(symbol: str = DEFAULT_SYMBOL) -> Dict[str, Any]:
     }
 
 
-def load_cache(symbol: str = DEFAULT_SYMBOL) -> List[List]:
+def _cache_files() -> tuple:
+    """(canonical JSON path, columnar .npy path) of the BTC basis cache."""
+    json_file = Path(CACHE_DIR) / "basis_spread_btc.json"
+    return json_file, json_file.with_suffix('.npy')
+
+
+def _to_array(records: List[List]) -> np.ndarray:
+    """[[timestamp_ms, value], ...] -> CACHE_DTYPE array sorted by timestamp."""
+    arr = np.empty(len(records), dtype=CACHE_DTYPE)
+    arr['timestamp'] = [record[0] for record in records]
+    arr['value'] = [np.nan if record[1] is None else record[1] for record in records]
+    arr.sort(order='timestamp', kind='stable')
+    return arr
+
+
+def _to_records(arr: np.ndarray) -> List[List]:
+    """CACHE_DTYPE array -> [[timestamp_ms, value], ...] (NaN -> None)."""
+    values = arr['value'].tolist()
+    return [[ts, None if value != value else value] for ts, value in zip(arr['timestamp'].tolist(), values)]
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Write via a temp file in the same directory, then os.replace() it over path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _remember_array(array_file: Path, arr: np.ndarray) -> None:
+    """Cache a freshly loaded or written array under its file's current mtime."""
+    arr.flags.writeable = False  # Shared between calls
+    _array_cache[array_file] = (array_file.stat().st_mtime_ns, arr)
+
+
+def load_cache_array(symbol: str = DEFAULT_SYMBOL) -> np.ndarray:
     """
-    Load basis spread data from disk cache.
+    Load basis spread data as a columnar array.
+
+    Reads the .npy copy when it is at least as new as the JSON cache (reusing
+    the array already loaded by this process if the file is unchanged);
+    otherwise parses the JSON once and (re)writes the .npy copy.
 
     Args:
         symbol: Trading pair symbol (default: BTCUSDT)
 
     Returns:
-        List of [timestamp_ms, basis_value] tuples, sorted by timestamp
+        Read-only CACHE_DTYPE array sorted by timestamp (empty if nothing is cached)
     """
     # For now, only BTC is supported
     if symbol != DEFAULT_SYMBOL:
         print(f"Warning: Only {DEFAULT_SYMBOL} basis spread is currently cached")
-        return []
+        return np.empty(0, dtype=CACHE_DTYPE)
 
-    cache_file = Path(CACHE_DIR) / "basis_spread_btc.json"
+    cache_file, array_file = _cache_files()
 
     if not cache_file.exists():
         print(f"Warning: {cache_file} not found. Run scripts/backfill_basis.py first.")
-        return []
+        return np.empty(0, dtype=CACHE_DTYPE)
+
+    if array_file.exists() and array_file.stat().st_mtime_ns >= cache_file.stat().st_mtime_ns:
+        cached = _array_cache.get(array_file)
+        if cached and cached[0] == array_file.stat().st_mtime_ns:
+            return cached[1]
+        arr = np.load(array_file)
+    else:
+        # First read (or JSON rewritten by a backfill): migrate to the columnar copy
+        arr = _to_array(parse_json(cache_file.read_bytes()))
+        _write_atomic(array_file, lambda f: np.save(f, arr))
+
+    _remember_array(array_file, arr)
+    return arr
+
 
-    with open(cache_file, 'r') as f:
-        data = json.load(f)
+def load_cache(symbol: str = DEFAULT_SYMBOL) -> List[List]:
+    """
+    Load basis spread data from disk cache.
+
+    Args:
+        symbol: Trading pair symbol (default: BTCUSDT)
 
-    return sorted(data, key=lambda x: x[0])
+    Returns:
+        List of [timestamp_ms, basis_value] tuples, sorted by timestamp
+    """
+    return _to_records(load_cache_array(symbol))
 
 
-def update_cache(symbol: str = DEFAULT_SYMBOL) -> None:
+def update_cache(symbol: str = DEFAULT_SYMBOL) -> np.ndarray:
     """
     Fetch recent basis spread data and append to cache if new.
 
     Args:
         symbol: Trading pair symbol (default: BTCUSDT)
+
+    Returns:
+        The up-to-date cache as a read-only CACHE_DTYPE array (the same array
+        load_cache_array would return), so callers need not load it again
     """
     if symbol != DEFAULT_SYMBOL:
-        return
+        return load_cache_array(symbol)
 
-    cache_file = Path(CACHE_DIR) / "basis_spread_btc.json"
+    cache_file, array_file = _cache_files()
 
     # Load existing data
-    existing_data = load_cache(symbol)
+    existing_data = load_cache_array(symbol)
 
-    if not existing_data:
+    if not len(existing_data):
         print(f"No cached data for {symbol} basis spread. Run backfill script first.")
-        return
+        return existing_data
 
     # Get latest timestamp in cache
-    latest_cached_ts = existing_data[-1][0]
-    latest_cached_date = datetime.fromtimestamp(latest_cached_ts / 1000)
+    latest_cached_ts = int(existing_data['timestamp'][-1])
 
     # Check if we need an update (more than 23 hours old)
-    now = datetime.now()
-    if (now - latest_cached_date).total_seconds() < 23 * 3600:
+    if time.time() * 1000 - latest_cached_ts < 23 * MS_PER_HOUR:
         # Data is recent, no update needed
-        return
+        return existing_data
 
     # Fetch recent data (last 30 days to ensure we capture latest)
     print(f"Fetching latest {symbol} basis spread...")
@@ -106,46 +187,50 @@ def update_cache(symbol: str = DEFAULT_SYMBOL) -> None:
 
     if not recent_data:
         print(f"Failed to fetch latest {symbol} basis spread")
-        return
+        return existing_data
 
     # Find new data points (timestamps newer than cache)
     new_points = [point for point in recent_data if point[0] > latest_cached_ts]
 
     if new_points:
-        # Append new points to existing data
-        existing_data.extend(new_points)
+        # Append only the new rows (sorted among themselves; all are newer)
+        updated = np.concatenate([existing_data, _to_array(new_points)])
 
-        # Sort by timestamp (should already be sorted, but ensure it)
-        existing_data.sort(key=lambda x: x[0])
-
-        # Save updated cache
-        cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        # Save updated cache: JSON first, then the columnar copy so it is
+        # never older than the JSON it mirrors
+        payload = dump_json(_to_records(updated))
+        _write_atomic(cache_file, lambda f: f.write(payload))
+        _write_atomic(array_file, lambda f: np.save(f, updated))
+        _remember_array(array_file, updated)
 
         print(f"Updated {symbol} basis spread cache with {len(new_points)} new points")
-    else:
-        print(f"{symbol} basis spread cache is up to date")
+        return updated
 
+    print(f"{symbol} basis spread cache is up to date")
+    return existing_data
 
-def filter_by_days(data: List[List], days: str) -> List[List]:
+
+def filter_by_days(data, days: str):
     """
     Filter data by number of days or return all.
 
     Args:
-        data: List of [timestamp_ms, value] tuples
+        data: List of [timestamp_ms, value] tuples, or a CACHE_DTYPE array
         days: Number of days ('7', '30', '90', '365') or 'max'
 
     Returns:
-        Filtered data
+        Filtered data (same type as data)
     """
     if days == 'max':
         return data
 
     try:
         num_days = int(days)
-        cutoff_ts = (datetime.now() - timedelta(days=num_days)).timestamp() * 1000
-        return [point for point in data if point[0] >= cutoff_ts]
+        cutoff_ts = time.time() * 1000 - num_days * 24 * MS_PER_HOUR
+        # Data is sorted by timestamp: binary-search the cut point
+        if isinstance(data, np.ndarray):
+            return data[np.searchsorted(data['timestamp'], cutoff_ts, side='left'):]
+        return data[bisect_left(data, cutoff_ts, key=lambda point: point[0]):]
     except ValueError:
         return data
 
@@ -163,13 +248,11 @@ def get_data(days: str = '365', asset: str = 'btc') -> Dict[str, Any]:
     """
     symbol = DEFAULT_SYMBOL  # Currently only BTCUSDT
 
-    # Update cache with latest data (if needed)
-    update_cache(symbol)
-
-    # Load from cache
-    data = load_cache(symbol)
+    # Update cache with latest data (if needed) and reuse the array it returns
+    # (columnar; only the requested window becomes lists)
+    data = update_cache(symbol)
 
-    if not data:
+    if not len(data):
         return {
             'metadata': get_metadata(symbol),
             'data': [],
@@ -177,7 +260,7 @@ def get_data(days: str = '365', asset: str = 'btc') -> Dict[str, Any]:
         }
 
     # Filter by time range
-    filtered_data = filter_by_days(data, days)
+    filtered_data = _to_records(filter_by_days(data, days))
 
     return {
         'metadata': get_metadata(symbol),
@@ -5,7 +5,12 @@ Handles basis spread, open interest history, and taker long/short ratio data
 with automatic stitching for multi-month historical fetches.
 """
 
+import heapq
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -22,6 +27,20 @@ from data.derivatives_config import (
 )
 from data.time_transformer import standardize_to_daily_utc
 
+# Shared HTTP session: keep-alive connections are reused across requests and
+# chunks (no new TCP/TLS handshake per call); the adapter retries failed
+# connections and 429/5xx responses with exponential backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=MAX_RETRIES - 1,  # MAX_RETRIES counts the first attempt
+        backoff_factor=RETRY_BACKOFF_BASE,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
 
 def fetch_binance_endpoint(
     endpoint: str,
@@ -31,6 +50,9 @@ def fetch_binance_endpoint(
     """
     Generic Binance Futures API fetcher with retry logic.
 
+    Connection errors and 429/5xx responses are retried by SESSION's adapter
+    (MAX_RETRIES attempts in total, exponential backoff).
+
     Args:
         endpoint: API endpoint path (e.g., '/futures/data/basis')
         params: Query parameters
@@ -44,28 +66,36 @@ def fetch_binance_endpoint(
     """
     url = f"{BINANCE_FUTURES_BASE}{endpoint}"
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+    response = SESSION.get(url, params=params, timeout=30)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+
+    if not isinstance(data, list):
+        raise ValueError(f"Expected list response, got: {type(data)}")
+
+    print(f"Fetched {len(data)} data points from {endpoint}")
+    return data
+
 
-            if not isinstance(data, list):
-                raise ValueError(f"Expected list response, got: {type(data)}")
+def _standardize_points(data: List[Dict[str, Any]], value_key: str) -> List[List]:
+    """
+    Convert API points to [timestamp_ms, value] pairs aligned to midnight UTC.
 
-            print(f"Fetched {len(data)} data points from {endpoint}")
-            return data
+    Builds the timestamp and value columns directly as arrays so
+    standardize_to_daily_utc can take its column-wise path.
 
-        except requests.exceptions.RequestException as e:
-            if attempt < MAX_RETRIES - 1:
-                wait_time = RETRY_BACKOFF_BASE * (2 ** attempt)
-                print(f"Binance API error (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                print(f"Retrying in {wait_time}s...")
-                time.sleep(wait_time)
-            else:
-                raise
+    Args:
+        data: Points returned by fetch_binance_endpoint
+        value_key: Key of the (string or numeric) value field in each point
 
-    raise requests.RequestException(f"Failed to fetch from {endpoint} after {MAX_RETRIES} attempts")
+    Returns:
+        List of [timestamp_ms, value] tuples
+    """
+    timestamps = np.fromiter((point['timestamp'] for point in data), dtype=np.int64, count=len(data))
+    values = np.fromiter((float(point[value_key]) for point in data), dtype=np.float64, count=len(data))
+
+    # Standardize timestamps to midnight UTC
+    return standardize_to_daily_utc(np.column_stack([timestamps, values]))
 
 
 def fetch_basis_spread(
@@ -95,15 +125,7 @@ def fetch_basis_spread(
 
     data = fetch_binance_endpoint(BINANCE_ENDPOINTS['basis'], params)
 
-    # Convert to standard format [timestamp, value]
-    raw_data = []
-    for point in data:
-        raw_data.append([point['timestamp'], float(point['basis'])])
-
-    # Standardize timestamps to midnight UTC
-    standardized = standardize_to_daily_utc(raw_data)
-
-    return standardized
+    return _standardize_points(data, 'basis')
 
 
 def fetch_oi_history(
@@ -130,15 +152,7 @@ def fetch_oi_history(
 
     data = fetch_binance_endpoint(BINANCE_ENDPOINTS['oi_history'], params)
 
-    # Convert to standard format [timestamp, value]
-    raw_data = []
-    for point in data:
-        raw_data.append([point['timestamp'], float(point['sumOpenInterest'])])
-
-    # Standardize timestamps to midnight UTC
-    standardized = standardize_to_daily_utc(raw_data)
-
-    return standardized
+    return _standardize_points(data, 'sumOpenInterest')
 
 
 def fetch_taker_ratio(
@@ -165,15 +179,7 @@ def fetch_taker_ratio(
 
     data = fetch_binance_endpoint(BINANCE_ENDPOINTS['taker_ratio'], params)
 
-    # Convert to standard format [timestamp, value]
-    raw_data = []
-    for point in data:
-        raw_data.append([point['timestamp'], float(point['buySellRatio'])])
-
-    # Standardize timestamps to midnight UTC
-    standardized = standardize_to_daily_utc(raw_data)
-
-    return standardized
+    return _standardize_points(data, 'buySellRatio')
 
 
 def fetch_with_stitching(
@@ -196,8 +202,7 @@ def fetch_with_stitching(
     Returns:
         Combined and deduplicated list of [timestamp_ms, value] tuples
     """
-    end_date = datetime.now()
-    all_data = {}  # Use dict to deduplicate by timestamp
+    chunks = []  # Each chunk is already sorted by timestamp
 
     # Calculate number of chunks needed
     num_chunks = (days_back + chunk_size_days - 1) // chunk_size_days
@@ -212,6 +217,7 @@ def fetch_with_stitching(
 
         print(f"Chunk {chunk_idx + 1}/{num_chunks}: Fetching {chunk_limit} days")
 
+        request_started = time.monotonic()
         try:
             chunk_data = fetch_function(
                 symbol=symbol,
@@ -219,20 +225,29 @@ def fetch_with_stitching(
                 **kwargs
             )
 
-            # Add to dictionary (automatic deduplication)
-            for ts, value in chunk_data:
-                all_data[ts] = value
+            chunks.append(chunk_data)
 
         except Exception as e:
             print(f"Error fetching chunk {chunk_idx + 1}: {e}")
             # Continue with next chunk rather than failing entirely
 
-        # Rate limit protection
+        # Rate limit protection: keep REQUEST_DELAY between request starts,
+        # counting the time the request itself took
         if chunk_idx < num_chunks - 1:
-            time.sleep(REQUEST_DELAY)
-
-    # Convert back to sorted list
-    sorted_data = sorted([[ts, val] for ts, val in all_data.items()])
+            remaining = REQUEST_DELAY - (time.monotonic() - request_started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    # Chunks overlap, so merge them in timestamp order and keep one point per
+    # timestamp; merge is stable, so the later chunk's value wins on ties
+    sorted_data = []
+    last_ts = None
+    for ts, val in heapq.merge(*chunks, key=lambda x: x[0]):
+        if ts == last_ts:
+            sorted_data[-1][1] = val
+        else:
+            sorted_data.append([ts, val])
+            last_ts = ts
 
     print(f"\nTotal data points collected: {len(sorted_data)}")
     if sorted_data:
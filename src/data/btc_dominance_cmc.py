@@ -21,6 +21,11 @@ Cache: 15-minute intervals (slower moving than price)
 """
 
 import requests
+import threading
+import time
+import numpy as np
+from functools import lru_cache
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
 from .coinmarketcap_client import (
     fetch_global_metrics,
@@ -34,13 +39,20 @@ from .incremental_data_manager import (
 )
 from .time_transformer import standardize_to_daily_utc
 
+# CoinMarketCap is polled at most once per update interval per process (free
+# tier: 333 calls/day); requests inside the window reuse the last fetched point
+FETCH_INTERVAL_SECONDS = 15 * 60
+_last_fetch = {'time': None, 'data': None}
+_fetch_lock = threading.Lock()
 
+
+@lru_cache(maxsize=16)
 def get_metadata():
     """
     Returns metadata describing how this data should be displayed.
 
     Returns:
-        dict: Display metadata for frontend rendering
+        dict: Display metadata for frontend rendering (cached; do not mutate)
     """
     return {
         'label': 'BTC.D (vs BTC)',
@@ -100,13 +112,36 @@ def fetch_current_btc_dominance():
         raise
 
 
+def fetch_current_btc_dominance_throttled():
+    """
+    fetch_current_btc_dominance(), reusing the last result for FETCH_INTERVAL_SECONDS.
+
+    Thread-safe: concurrent requests wait for a single in-flight fetch.
+    Failed fetches are not cached.
+
+    Returns:
+        list: [[timestamp_ms, dominance_pct]] with single data point
+    """
+    with _fetch_lock:
+        fetched_at = _last_fetch['time']
+        now = time.monotonic()
+        if fetched_at is not None and now - fetched_at < FETCH_INTERVAL_SECONDS:
+            print(f"[BTC Dominance CMC] Reusing value fetched {now - fetched_at:.0f}s ago")
+            return _last_fetch['data']
+
+        data = fetch_current_btc_dominance()
+        _last_fetch['time'] = time.monotonic()
+        _last_fetch['data'] = data
+        return data
+
+
 def get_data(days='1095', asset='btc'):
     """
     Fetches BTC dominance data using incremental fetching strategy.
 
     Strategy:
     1. Load existing historical data from cache
-    2. Fetch current dominance from CoinMarketCap
+    2. Fetch current dominance from CoinMarketCap (at most every 15 minutes)
     3. Merge with historical data
     4. Save updated cache
     5. Return requested days
@@ -138,7 +173,7 @@ def get_data(days='1095', asset='btc'):
 
     # Step 2: Fetch current dominance
     try:
-        new_data = fetch_current_btc_dominance()
+        new_data = fetch_current_btc_dominance_throttled()
     except Exception as e:
         print(f"[BTC Dominance CMC] Error fetching current data: {e}")
         # Fallback to historical data if fetch fails
@@ -149,7 +184,13 @@ def get_data(days='1095', asset='btc'):
             raise
 
     # Step 3: Merge with historical data
-    if new_data:
+    if new_data and historical_data and new_data[0][0] > historical_data[-1][0]:
+        # Common case: the fetched point is newer than everything cached, so
+        # append it (load_historical_data returns a fresh list)
+        merged_data = historical_data
+        merged_data.extend(new_data)
+        print(f"[BTC Dominance CMC] Appended {len(new_data)} new to {len(merged_data) - len(new_data)} historical = {len(merged_data)} total")
+    elif new_data:
         merged_data = merge_and_deduplicate(historical_data, new_data)
         print(f"[BTC Dominance CMC] Merged {len(historical_data)} historical + {len(new_data)} new = {len(merged_data)} total")
     else:
@@ -158,8 +199,14 @@ def get_data(days='1095', asset='btc'):
 
     # Step 4: Standardize timestamps and save updated cache
     if merged_data:
-        # Standardize timestamps to daily UTC (00:00:00) for alignment with BTC
-        standardized_data = standardize_to_daily_utc(merged_data)
+        # Standardize timestamps to daily UTC (00:00:00) for alignment with BTC.
+        # Passed as one float array (gap days None -> NaN) so the timestamps are
+        # floored column-wise; NaN comes back as None for the JSON cache
+        merged_array = np.array(merged_data, dtype=np.float64)
+        standardized_data = [
+            [ts, None if value != value else value]
+            for ts, value in standardize_to_daily_utc(merged_array)
+        ]
         save_historical_data(dataset_name, standardized_data)
         print(f"[BTC Dominance CMC] Standardized timestamps to midnight UTC for BTC alignment")
     else:
@@ -179,8 +226,8 @@ def get_data(days='1095', asset='btc'):
         days_int = int(days)
         # Calculate cutoff timestamp (days ago)
         cutoff_timestamp = standardized_data[-1][0] - (days_int * 24 * 60 * 60 * 1000)
-        # Filter data >= cutoff
-        result_data = [d for d in standardized_data if d[0] >= cutoff_timestamp]
+        # Filter data >= cutoff (sorted by timestamp: binary-search the cut point)
+        result_data = standardized_data[bisect_left(standardized_data, cutoff_timestamp, key=lambda d: d[0]):]
 
         # If not enough data, return all available
         if len(result_data) < 10:
@@ -188,18 +235,21 @@ def get_data(days='1095', asset='btc'):
             result_data = standardized_data
 
     print(f"[BTC Dominance CMC] Returning {len(result_data)} records")
+
+    # CRITICAL: Filter out None values before returning (prevents Z-score calculation errors)
+    valid_data = [[ts, val] for ts, val in result_data if val is not None]
+
     if result_data:
         start_ts = result_data[0][0]
         end_ts = result_data[-1][0]
         start_date_obj = datetime.fromtimestamp(start_ts / 1000, tz=timezone.utc)
         end_date_obj = datetime.fromtimestamp(end_ts / 1000, tz=timezone.utc)
         print(f"[BTC Dominance CMC] Date range: {start_date_obj.strftime('%Y-%m-%d')} to {end_date_obj.strftime('%Y-%m-%d')}")
-        valid_values = [d[1] for d in result_data if d[1] is not None]
-        if valid_values:
-            print(f"[BTC Dominance CMC] BTC.D range: {min(valid_values):.2f}% to {max(valid_values):.2f}%")
+        if valid_data:
+            valid_values = np.fromiter((d[1] for d in valid_data), dtype=np.float64, count=len(valid_data))
+            print(f"[BTC Dominance CMC] BTC.D range: {valid_values.min():.2f}% to {valid_values.max():.2f}%")
 
-    # CRITICAL: Filter out None values before returning (prevents Z-score calculation errors)
-    result_data = [[ts, val] for ts, val in result_data if val is not None]
+    result_data = valid_data
     if len(result_data) < len([d for d in standardized_data if d[1] is not None]):
         print(f"[BTC Dominance CMC] Warning: Filtered out {len(standardized_data) - len(result_data)} None values")
 
@@ -1,6 +1,8 @@
 # filename: data/cache_manager.py
 import json
 import os
+from pathlib import Path
+from .json_utils import parse_json, dump_json
 
 # Create a directory for cache files if it doesn't exist
 CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'storage', 'cache')
@@ -9,17 +11,21 @@ if not os.path.exists(CACHE_DIR):
 
 def load_from_cache(dataset_name):
     """Loads a dataset from its JSON cache file, if it exists."""
-    cache_file = os.path.join(CACHE_DIR, f"{dataset_name}.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return [] # Return empty list if cache is corrupt
-    return []
+    cache_file = Path(CACHE_DIR) / f"{dataset_name}.json"
+    try:
+        # One read of the whole file, no text decoding (JSON parsers take bytes)
+        return parse_json(cache_file.read_bytes())
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError:
+        return [] # Return empty list if cache is corrupt
 
 def save_to_cache(dataset_name, data):
     """Saves a dataset to its JSON cache file."""
     cache_file = os.path.join(CACHE_DIR, f"{dataset_name}.json")
-    with open(cache_file, 'w') as f:
-        json.dump(data, f)
\ No newline at end of file
+    # Write a temp file and rename it over the cache: a crash mid-write leaves
+    # the previous cache intact instead of a torn file that loads as []
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(dump_json(data))
+    os.replace(tmp_file, cache_file)
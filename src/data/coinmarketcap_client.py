@@ -11,17 +11,31 @@ Free Tier: 10,000 calls/month (333 calls/day)
 """
 
 import requests
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
+import orjson
 
 CMC_BASE_URL = 'https://pro-api.coinmarketcap.com'
 
+# Shared HTTP session: keep-alive connections are reused across requests
+# (no new TCP/TLS handshake per call). The API key headers are added on first
+# use (see _session) so the config import still happens after .env is loaded
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
 
+
+@lru_cache(maxsize=1)
 def get_headers():
     """
     Returns standard CoinMarketCap API headers with authentication.
 
+    The config import and key check run once; failures are not cached, so a
+    missing key keeps raising until it is configured.
+
     Returns:
-        dict: Headers dictionary with API key
+        dict: Headers dictionary with API key (cached; do not mutate)
 
     Raises:
         ValueError: If API key is not configured
@@ -41,6 +55,18 @@ def get_headers():
     }
 
 
+def _session():
+    """
+    Returns SESSION with the authentication headers set.
+
+    Raises:
+        ValueError: If API key is not configured
+    """
+    if 'X-CMC_PRO_API_KEY' not in SESSION.headers:
+        SESSION.headers.update(get_headers())
+    return SESSION
+
+
 def fetch_global_metrics():
     """
     Fetch current global crypto market metrics.
@@ -76,10 +102,10 @@ def fetch_global_metrics():
     """
     url = f'{CMC_BASE_URL}/v1/global-metrics/quotes/latest'
 
-    response = requests.get(url, headers=get_headers(), timeout=30)
+    response = _session().get(url, timeout=30)
     response.raise_for_status()
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def fetch_coin_quote(symbol):
@@ -127,10 +153,10 @@ def fetch_coin_quote(symbol):
     url = f'{CMC_BASE_URL}/v1/cryptocurrency/quotes/latest'
     params = {'symbol': symbol.upper()}
 
-    response = requests.get(url, headers=get_headers(), params=params, timeout=30)
+    response = _session().get(url, params=params, timeout=30)
     response.raise_for_status()
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def extract_global_metric(response, metric_name):
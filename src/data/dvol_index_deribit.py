@@ -9,14 +9,25 @@ Cache: historical_data/dvol_{currency}.json
 Update Strategy: Incremental daily updates appended to cache
 """
 
-import json
 import os
+from bisect import bisect_left
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
+import orjson
 from data.deribit_utils import get_latest_dvol
 from data.derivatives_config import CACHE_DIR
 
+# Parsed caches keyed by file path -> ((mtime_ns, size), sorted data). The file
+# changes about once a day, so requests in between skip the JSON parse
+_MEM_CACHE = {}
+
+
+def _file_signature(path: Path) -> tuple:
+    """(mtime_ns, size) of a file; changes whenever the file is rewritten."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
 
 def get_metadata(currency: str = 'BTC') -> Dict[str, Any]:
     """
@@ -55,10 +66,17 @@ def load_cache(currency: str = 'BTC') -> List[List]:
         print(f"Warning: {cache_file} not found. Run scripts/backfill_dvol.py first.")
         return []
 
-    with open(cache_file, 'r') as f:
-        data = json.load(f)
+    signature = _file_signature(cache_file)
+    cached = _MEM_CACHE.get(cache_file)
+    if cached is None or cached[0] != signature:
+        # One read of the whole file, no text decoding (JSON parsers take bytes)
+        raw = cache_file.read_bytes()
+        data = orjson.loads(raw)
+        cached = _MEM_CACHE[cache_file] = (signature, sorted(data, key=lambda x: x[0]))
 
-    return sorted(data, key=lambda x: x[0])
+    # Copy the rows too: callers may edit records in place, which must not
+    # leak into the cached copy later requests are served from
+    return [list(record) for record in cached[1]]
 
 
 def update_cache(currency: str = 'BTC') -> None:
@@ -70,7 +88,7 @@ def update_cache(currency: str = 'BTC') -> None:
     """
     cache_file = Path(CACHE_DIR) / f"dvol_{currency.lower()}.json"
 
-    # Load existing data
+    # Load existing data (served from _MEM_CACHE unless the file changed)
     existing_data = load_cache(currency)
 
     if not existing_data:
@@ -103,8 +121,15 @@ def update_cache(currency: str = 'BTC') -> None:
 
         # Save updated cache
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_file, 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        # Write a temp file and rename it over the cache so a crash mid-write
+        # cannot leave a torn cache behind
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(existing_data))
+        os.replace(tmp_file, cache_file)
+        # The next load sees the new signature; seed it with what was just written
+        # (existing_data is load_cache's copy, so no caller shares its rows)
+        _MEM_CACHE[cache_file] = (_file_signature(cache_file), existing_data)
 
         print(f"Updated {currency} DVOL cache with latest value: {latest_value}")
     else:
@@ -128,7 +153,8 @@ def filter_by_days(data: List[List], days: str) -> List[List]:
     try:
         num_days = int(days)
         cutoff_ts = (datetime.now() - timedelta(days=num_days)).timestamp() * 1000
-        return [point for point in data if point[0] >= cutoff_ts]
+        # Data is sorted by timestamp: binary-search the cut point
+        return data[bisect_left(data, cutoff_ts, key=lambda point: point[0]):]
     except ValueError:
         return data
 
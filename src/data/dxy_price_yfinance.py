@@ -26,6 +26,7 @@ Use Case:
 Ticker Symbol: DX-Y.NYB
 """
 
+import numpy as np
 import yfinance as yf
 from datetime import datetime, timedelta, timezone
 from .incremental_data_manager import (
@@ -84,21 +85,18 @@ def fetch_from_yfinance(start_date, end_date):
         print(f"[DXY YFinance] No data returned from Yahoo Finance")
         return []
 
-    # Convert DataFrame to simple format [[timestamp_ms, close_price], ...]
-    # Filter out weekends (DXY is market hours only: Mon-Fri)
-    raw_data = []
-    for index, row in hist.iterrows():
-        # Skip weekends (Saturday=5, Sunday=6)
-        if index.weekday() in [5, 6]:
-            continue
-
-        # Convert pandas Timestamp to milliseconds
-        timestamp_ms = int(index.timestamp() * 1000)
-        close_price = float(row['Close'])
-        raw_data.append([timestamp_ms, close_price])
+    # Filter out weekends (DXY is market hours only: Mon-Fri; Saturday=5, Sunday=6)
+    hist = hist[hist.index.weekday < 5]
 
     # Sort by timestamp (should already be sorted, but ensure)
-    raw_data.sort(key=lambda x: x[0])
+    if not hist.index.is_monotonic_increasing:
+        hist = hist.sort_index()
+
+    # Convert DataFrame to simple format [[timestamp_ms, close_price], ...]
+    # column-wise; index values are UTC datetime64 (unit varies by pandas version)
+    timestamps_ms = hist.index.values.astype('datetime64[ms]').astype(np.int64)
+    close_prices = hist['Close'].to_numpy(dtype=np.float64)
+    raw_data = [list(pair) for pair in zip(timestamps_ms.tolist(), close_prices.tolist())]
 
     print(f"[DXY YFinance] Successfully fetched {len(raw_data)} data points")
     if raw_data:
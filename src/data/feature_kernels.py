@@ -0,0 +1,250 @@
+# data/feature_kernels.py
+"""
+Feature Preprocessing Kernels
+
+Computes the per-row momentum, volume and volatility columns of the `features`
+table (database/models/analytics.py) in a single pass over float64 arrays of
+closes and volumes, instead of building Decimal values row by row in Python.
+
+The kernel is compiled with Numba when available (see numba_utils). Indicator
+definitions match the chart plugins so stored features agree with the dashboard:
+- RSI: Wilder's smoothing, 14 periods (same as rsi.calculate_rsi)
+- MACD: 12/26 EMAs seeded with an SMA, 9-period signal (same as macd_histogram)
+- Volume: 20-period SMA and current/SMA ratio
+- Volatility: rolling stdev of log returns (7/30/90), annualized, in percent
+
+Output is an (N, len(FEATURE_COLUMNS)) float64 array; NaN marks rows without
+enough history for a given column.
+"""
+
+import math
+import numpy as np
+from datetime import datetime, timezone
+from .numba_utils import njit
+
+# Column order of the kernel output (names match Feature model columns)
+FEATURE_COLUMNS = (
+    'rsi_value',
+    'rsi_momentum',
+    'macd_value',
+    'macd_signal',
+    'volume_sma_20',
+    'volume_ratio',
+    'volatility_7d',
+    'volatility_30d',
+    'volatility_90d',
+)
+
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+VOLUME_SMA_PERIOD = 20
+VOLATILITY_WINDOWS = (7, 30, 90)
+ANNUALIZATION = math.sqrt(252)  # Same factor as volatility.py
+
+
+@njit(cache=True)
+def _ema_into(values, start, period, out):
+    """
+    EMA of values[start:] seeded with the SMA of its first `period` values.
+    Writes into out (already NaN-filled); leaves out untouched if too short.
+    """
+    n = values.shape[0]
+    if n - start < period:
+        return
+
+    seed = 0.0
+    for i in range(start, start + period):
+        seed += values[i]
+    ema = seed / period
+    out[start + period - 1] = ema
+
+    alpha = 2.0 / (period + 1)
+    for i in range(start + period, n):
+        ema = (values[i] - ema) * alpha + ema
+        out[i] = ema
+
+
+@njit(cache=True)
+def _rolling_volatility_into(log_returns, window, annualization, out, col):
+    """Rolling sample stdev of log returns over `window`, written to out[:, col]."""
+    n = log_returns.shape[0]
+    if n < window or window < 2:
+        return
+
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        r = log_returns[i]
+        total += r
+        total_sq += r * r
+        if i >= window:
+            old = log_returns[i - window]
+            total -= old
+            total_sq -= old * old
+        if i >= window - 1:
+            var = (total_sq - total * total / window) / (window - 1)
+            if var < 0.0:
+                var = 0.0
+            # log_returns[i] is the return into bar i + 1
+            out[i + 1, col] = math.sqrt(var) * annualization * 100.0
+
+
+@njit(cache=True)
+def compute_features(close, volume, out):
+    """
+    Fill `out` (shape (N, 9), float64) with feature columns for each bar.
+
+    Args:
+        close: float64[:] closing prices, oldest first
+        volume: float64[:] volumes aligned with close
+        out: float64[:, :] output buffer, columns ordered as FEATURE_COLUMNS
+    """
+    n = close.shape[0]
+    out[:, :] = np.nan
+    if n < 2:
+        return
+
+    # --- RSI (Wilder's smoothing) + momentum --------------------------------
+    period = RSI_PERIOD
+    if n >= period + 1:
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(period):
+            delta = close[i + 1] - close[i]
+            if delta > 0:
+                avg_gain += delta
+            else:
+                avg_loss -= delta
+        avg_gain /= period
+        avg_loss /= period
+
+        for i in range(period, n):
+            if i > period:
+                delta = close[i] - close[i - 1]
+                gain = delta if delta > 0 else 0.0
+                loss = -delta if delta < 0 else 0.0
+                avg_gain = (avg_gain * (period - 1) + gain) / period
+                avg_loss = (avg_loss * (period - 1) + loss) / period
+
+            if avg_loss == 0:
+                rsi = 100.0
+            else:
+                rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            out[i, 0] = rsi
+            if i > period:
+                out[i, 1] = rsi - out[i - 1, 0]
+
+    # --- MACD line and signal ----------------------------------------------
+    fast = np.full(n, np.nan)
+    slow = np.full(n, np.nan)
+    _ema_into(close, 0, MACD_FAST, fast)
+    _ema_into(close, 0, MACD_SLOW, slow)
+
+    macd = np.full(n, np.nan)
+    for i in range(MACD_SLOW - 1, n):
+        macd[i] = fast[i] - slow[i]
+        out[i, 2] = macd[i]
+
+    signal = np.full(n, np.nan)
+    _ema_into(macd, MACD_SLOW - 1, MACD_SIGNAL, signal)
+    for i in range(n):
+        out[i, 3] = signal[i]
+
+    # --- Volume SMA and ratio ----------------------------------------------
+    window = VOLUME_SMA_PERIOD
+    running = 0.0
+    for i in range(n):
+        running += volume[i]
+        if i >= window:
+            running -= volume[i - window]
+        if i >= window - 1:
+            sma = running / window
+            out[i, 4] = sma
+            if sma > 0:
+                out[i, 5] = volume[i] / sma
+
+    # --- Volatility ---------------------------------------------------------
+    log_returns = np.empty(n - 1)
+    for i in range(n - 1):
+        if close[i] > 0 and close[i + 1] > 0:
+            log_returns[i] = math.log(close[i + 1] / close[i])
+        else:
+            log_returns[i] = 0.0
+
+    _rolling_volatility_into(log_returns, VOLATILITY_WINDOWS[0], ANNUALIZATION, out, 6)
+    _rolling_volatility_into(log_returns, VOLATILITY_WINDOWS[1], ANNUALIZATION, out, 7)
+    _rolling_volatility_into(log_returns, VOLATILITY_WINDOWS[2], ANNUALIZATION, out, 8)
+
+
+def calculate_features(close, volume):
+    """
+    Allocate the output buffer and run the feature kernel.
+
+    Args:
+        close (array-like): Closing prices, oldest first
+        volume (array-like): Volumes aligned with close
+
+    Returns:
+        np.ndarray: (N, len(FEATURE_COLUMNS)) float64 array (NaN = not enough history)
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    volume = np.ascontiguousarray(volume, dtype=np.float64)
+    out = np.empty((close.shape[0], len(FEATURE_COLUMNS)), dtype=np.float64)
+    compute_features(close, volume, out)
+    return out
+
+
+def calculate_features_from_ohlcv(ohlcv_data):
+    """
+    Run the feature kernel over OHLCV rows.
+
+    Args:
+        ohlcv_data (list): [[timestamp, open, high, low, close, volume], ...]
+
+    Returns:
+        tuple: (timestamps_ms int64 array, features (N, k) float64 array)
+    """
+    if not ohlcv_data:
+        return np.empty(0, dtype=np.int64), np.empty((0, len(FEATURE_COLUMNS)))
+
+    arr = np.asarray(ohlcv_data, dtype=np.float64)
+    timestamps = arr[:, 0].astype(np.int64)
+    return timestamps, calculate_features(arr[:, 4], arr[:, 5])
+
+
+def feature_columns(features):
+    """
+    Split the kernel output into contiguous per-column arrays.
+
+    Returns:
+        dict: {column_name: float64 array} ready for a columnar bulk load
+    """
+    return {
+        name: np.ascontiguousarray(features[:, i])
+        for i, name in enumerate(FEATURE_COLUMNS)
+    }
+
+
+def build_feature_records(source_id, timestamps, features):
+    """
+    Convert kernel output into Feature rows for bulk_upsert.
+
+    Rows where every column is NaN (warm-up period) are skipped;
+    remaining NaN values become NULL.
+
+    Returns:
+        list: [{'source_id', 'timestamp', <FEATURE_COLUMNS>...}, ...]
+    """
+    records = []
+    valid_rows = ~np.all(np.isnan(features), axis=1)
+    for ts_ms, row in zip(timestamps[valid_rows].tolist(), features[valid_rows].tolist()):
+        record = {
+            'source_id': source_id,
+            'timestamp': datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc),
+        }
+        for name, value in zip(FEATURE_COLUMNS, row):
+            record[name] = None if math.isnan(value) else value
+        records.append(record)
+    return records
@@ -10,7 +10,9 @@ This module provides a reusable system that all plugins can use to:
 
 import json
 import os
+from bisect import bisect_left
 from datetime import datetime, timedelta, timezone
+from .json_utils import parse_json, dump_json
 
 # Create directory for historical data storage
 HISTORICAL_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'storage', 'data')
@@ -18,6 +20,27 @@ if not os.path.exists(HISTORICAL_DATA_DIR):
     os.makedirs(HISTORICAL_DATA_DIR)
     print(f"[Incremental Manager] Created historical_data directory at {HISTORICAL_DATA_DIR}")
 
+# Parsed datasets keyed by path -> ((mtime_ns, size), data). A file is only
+# re-parsed after it changes on disk, so back-to-back loads of the same
+# dataset (last-timestamp check, then merge) cost one parse
+_HISTORY_CACHE = {}
+HISTORY_CACHE_MAX_ENTRIES = 64
+
+# Bytes read from the end of a dataset file to find its last record
+TAIL_READ_BYTES = 4096
+
+def _file_signature(filepath):
+    """(mtime_ns, size) of a file; changes whenever the file is rewritten."""
+    stat = os.stat(filepath)
+    return stat.st_mtime_ns, stat.st_size
+
+def _cache_history(filepath, signature, data):
+    """Remember a dataset's parsed contents, evicting the oldest entry when full."""
+    _HISTORY_CACHE.pop(filepath, None)
+    if len(_HISTORY_CACHE) >= HISTORY_CACHE_MAX_ENTRIES:
+        _HISTORY_CACHE.pop(next(iter(_HISTORY_CACHE)))
+    _HISTORY_CACHE[filepath] = (signature, data)
+
 def load_historical_data(dataset_name):
     """
     Load existing historical data for a dataset from its JSON file.
@@ -35,10 +58,18 @@ def load_historical_data(dataset_name):
         return []
 
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            print(f"[Incremental Manager] Loaded {len(data)} historical records for {dataset_name}")
-            return data
+        signature = _file_signature(filepath)
+        cached = _HISTORY_CACHE.get(filepath)
+        if cached and cached[0] == signature:
+            data = cached[1]
+        else:
+            with open(filepath, 'rb') as f:
+                data = parse_json(f.read())
+            _cache_history(filepath, signature, data)
+        print(f"[Incremental Manager] Loaded {len(data)} historical records for {dataset_name}")
+        # Copy the rows too: callers may edit records in place, which must not
+        # leak into the cached copy other loads are served from
+        return [list(record) for record in data]
     except json.JSONDecodeError as e:
         print(f"[Incremental Manager] Error loading {dataset_name}: {e}")
         return []
@@ -57,12 +88,56 @@ def save_historical_data(dataset_name, data):
     filepath = os.path.join(HISTORICAL_DATA_DIR, f"{dataset_name}.json")
 
     try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f)
+        with open(filepath, 'wb') as f:
+            f.write(dump_json(data))
+        # The next load sees the new signature; seed it with a row-wise copy
+        # (not the caller's lists, which it may keep editing). dump_json keeps
+        # NaN, so the copy matches what a load from disk returns
+        _cache_history(filepath, _file_signature(filepath), [list(record) for record in data])
         print(f"[Incremental Manager] Saved {len(data)} records to {dataset_name}.json")
     except Exception as e:
         print(f"[Incremental Manager] Error saving {dataset_name}: {e}")
 
+def get_last_timestamp_fast(dataset_name):
+    """
+    Timestamp of the last record in a dataset, read from the file tail.
+
+    Records are flat [timestamp, ...] lists, so the last one starts at the
+    last '[' of the file. Only the final TAIL_READ_BYTES are read and parsed;
+    an already-cached dataset is answered from memory, and anything the tail
+    does not cover falls back to a full load.
+
+    Args:
+        dataset_name (str): Name of the dataset
+
+    Returns:
+        int: Last timestamp in milliseconds, or None if no data exists
+    """
+    filepath = os.path.join(HISTORICAL_DATA_DIR, f"{dataset_name}.json")
+
+    try:
+        signature = _file_signature(filepath)
+    except OSError:
+        return None
+
+    cached = _HISTORY_CACHE.get(filepath)
+    if cached and cached[0] == signature:
+        return cached[1][-1][0] if cached[1] else None
+
+    try:
+        with open(filepath, 'rb') as f:
+            f.seek(max(signature[1] - TAIL_READ_BYTES, 0))
+            tail = f.read().rstrip()
+        # Strip the outer array's closing bracket, then take the last record
+        start = tail[:-1].rfind(b'[')
+        if tail.endswith(b']') and start > 0:
+            return parse_json(tail[start:-1].rstrip())[0]
+    except (ValueError, IndexError, TypeError):
+        pass
+
+    data = load_historical_data(dataset_name)
+    return data[-1][0] if data else None
+
 def get_last_timestamp(dataset_name):
     """
     Get the most recent timestamp from historical data.
@@ -87,7 +162,7 @@ def get_last_timestamp(dataset_name):
         print(f"[Incremental Manager] Error getting last timestamp for {dataset_name}: {e}")
         return None
 
-def merge_and_deduplicate(existing_data, new_data, overlap_days=3):
+def merge_and_deduplicate(existing_data, new_data, overlap_days=3, return_added=False):
     """
     Intelligently merge new data with existing historical data.
 
@@ -95,29 +170,40 @@ def merge_and_deduplicate(existing_data, new_data, overlap_days=3):
     - Identify overlap period (last N days of existing data)
     - Replace overlapping data with fresh data (handles corrections/adjustments)
     - Append truly new data
-    - Sort by timestamp
-    - Remove exact duplicates
+    - Merge by timestamp, exploiting that both inputs are sorted
+    - Remove exact duplicates (the fresh record wins)
+
+    Existing data is expected in chronological order (it is always the output
+    of a previous merge), so the untouched history before the new data is
+    copied as one slice and only the overlapping tail is merged record by
+    record; nothing is re-sorted.
 
     Args:
         existing_data (list): Historical data already stored
         new_data (list): Fresh data from API
         overlap_days (int): Number of days to treat as overlap/replacement zone
+        return_added (bool): Also return how many timestamps were not in existing_data
 
     Returns:
         list: Merged and deduplicated dataset, sorted chronologically
+              (or a (merged, added_count) tuple when return_added is True)
     """
     if not existing_data:
         print(f"[Incremental Manager] No existing data, returning new data as-is")
-        return sorted(new_data, key=lambda x: x[0]) if new_data else []
+        merged = sorted(new_data, key=lambda x: x[0]) if new_data else []
+        return (merged, len(merged)) if return_added else merged
 
     if not new_data:
         print(f"[Incremental Manager] No new data, returning existing data as-is")
-        return existing_data
+        return (existing_data, 0) if return_added else existing_data
 
     print(f"[Incremental Manager] Merging {len(existing_data)} existing + {len(new_data)} new records")
 
+    def timestamp_of(record):
+        return record[0]
+
     # Calculate overlap cutoff timestamp
-    last_timestamp = max(record[0] for record in existing_data if isinstance(record, (list, tuple)))
+    last_timestamp = existing_data[-1][0]
     last_date = datetime.fromtimestamp(last_timestamp / 1000, tz=timezone.utc)
     overlap_cutoff_date = last_date - timedelta(days=overlap_days)
     overlap_cutoff_ms = int(overlap_cutoff_date.timestamp() * 1000)
@@ -125,39 +211,46 @@ def merge_and_deduplicate(existing_data, new_data, overlap_days=3):
     print(f"[Incremental Manager] Overlap cutoff: {overlap_cutoff_date.date()} (replacing data from this date forward)")
 
     # Keep only data BEFORE the overlap cutoff from existing data
-    retained_existing = [record for record in existing_data if record[0] < overlap_cutoff_ms]
-    print(f"[Incremental Manager] Retained {len(retained_existing)} records before overlap cutoff")
-
-    # Combine retained existing data with ALL new data
-    combined_data = retained_existing + new_data
-
-    # Sort by timestamp
-    combined_data.sort(key=lambda x: x[0])
-
-    # Remove exact duplicates based on timestamp
-    deduplicated = []
-    seen_timestamps = set()
+    retained_count = bisect_left(existing_data, overlap_cutoff_ms, key=timestamp_of)
+    print(f"[Incremental Manager] Retained {retained_count} records before overlap cutoff")
+
+    # API pages are usually sorted already, which makes this a linear pass
+    new_sorted = sorted(new_data, key=timestamp_of)
+
+    # Retained history older than every new record is copied untouched
+    split = bisect_left(existing_data, new_sorted[0][0], 0, retained_count, key=timestamp_of)
+    deduplicated = existing_data[:split]
+
+    # Two-pointer merge of the remaining retained records with the new ones.
+    # On equal timestamps the existing record is emitted first, so the fresh
+    # record replaces it in place
+    i, j = split, 0
+    while i < retained_count or j < len(new_sorted):
+        if j == len(new_sorted) or (i < retained_count and existing_data[i][0] <= new_sorted[j][0]):
+            record = existing_data[i]
+            i += 1
+        else:
+            record = new_sorted[j]
+            j += 1
 
-    for record in combined_data:
-        timestamp = record[0]
-        if timestamp not in seen_timestamps:
-            deduplicated.append(record)
-            seen_timestamps.add(timestamp)
+        if deduplicated and deduplicated[-1][0] == record[0]:
+            deduplicated[-1] = record
         else:
-            # If duplicate timestamp exists, keep the newer record (last occurrence)
-            # Find and replace the existing record
-            for i, existing_record in enumerate(deduplicated):
-                if existing_record[0] == timestamp:
-                    deduplicated[i] = record
-                    break
+            deduplicated.append(record)
 
     print(f"[Incremental Manager] Final merged dataset: {len(deduplicated)} records")
 
-    # Validate chronological order
-    for i in range(1, len(deduplicated)):
+    # Validate chronological order where records were merged
+    for i in range(max(split, 1), len(deduplicated)):
         if deduplicated[i][0] <= deduplicated[i-1][0]:
             print(f"[Incremental Manager] Warning: Non-chronological data detected at index {i}")
 
+    if return_added:
+        # Only existing records at or after the split can share a timestamp
+        existing_timestamps = {record[0] for record in existing_data[split:]}
+        added = sum(1 for record in deduplicated[split:] if record[0] not in existing_timestamps)
+        return deduplicated, added
+
     return deduplicated
 
 def get_fetch_start_date(dataset_name, overlap_days=3, default_days=365):
@@ -0,0 +1,73 @@
+# data/json_utils.py
+"""
+JSON (de)serialization for the on-disk dataset and cache files
+
+orjson handles the common case. It has no NaN literal, though: it writes NaN
+as null, which loads back as None and breaks arithmetic in the indicators
+that read the datasets. Gap days from create_continuous_index_with_nan are
+NaN, so data holding non-finite floats is written with the stdlib encoder,
+which keeps them as NaN/Infinity tokens (and None as null), as json.dump
+always did. The encoder is chosen before serializing and the parser before
+parsing, so each payload is encoded or parsed exactly once.
+"""
+
+import json
+import math
+from itertools import chain
+import numpy as np
+import orjson
+
+# Tokens the stdlib encoder emits for non-finite floats (orjson rejects them)
+NON_FINITE_TOKENS = (b'NaN', b'Infinity')
+
+
+def _to_builtin(obj):
+    """json.dumps default: NumPy arrays and scalars -> Python lists/numbers."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite(data):
+    """True if data holds a NaN or infinite float (which orjson writes as null)."""
+    if isinstance(data, np.ndarray):
+        return data.dtype.kind == 'f' and not np.isfinite(data).all()
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        data = list(data.values())
+    if isinstance(data, (list, tuple)):
+        try:
+            # Rows of numbers: one C-level sum over every value, which is
+            # NaN/inf exactly when a value is (or, harmlessly, on overflow)
+            return not math.isfinite(sum(chain.from_iterable(data)))
+        except (TypeError, OverflowError):
+            # Flat values, None or strings in the rows: check item by item
+            return any(_has_non_finite(item) for item in data)
+    return False
+
+
+def parse_json(raw):
+    """Parse JSON bytes: stdlib json if they hold NaN/Infinity tokens, orjson otherwise."""
+    if any(token in raw for token in NON_FINITE_TOKENS):
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def dump_json(data):
+    """
+    Serialize data to compact JSON bytes, preserving NaN.
+
+    Args:
+        data: JSON-compatible data (NumPy arrays and scalars allowed)
+
+    Returns:
+        bytes: orjson output, or stdlib json output if data holds non-finite
+               floats or a type orjson does not support
+    """
+    if not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # Type orjson does not support; fall back to stdlib json
+    return json.dumps(data, separators=(',', ':'), default=_to_builtin).encode()
@@ -0,0 +1,25 @@
+# data/numba_utils.py
+"""
+Optional Numba JIT support for indicator kernels
+
+Numba compiles the tight recurrence loops (Wilder smoothing, EMA, RSI) used by
+the indicator modules to machine code. It is an optional dependency: when it
+is not installed, `njit` degrades to a no-op decorator and the kernels run as
+plain Python over NumPy arrays with identical results.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parameterized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
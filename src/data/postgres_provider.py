@@ -1,7 +1,6 @@
 """PostgreSQL Data Provider - No JSON fallback"""
 from datetime import datetime, timedelta
-from database.models import get_db, Source, TimeseriesData
-from sqlalchemy import and_
+from database.models import get_db, Source, TimeseriesData, copy_to_arrays
 
 def get_data(dataset_name, days=365):
     """
@@ -21,17 +20,19 @@ def get_data(dataset_name, days=365):
             return []
 
         cutoff = datetime.now() - timedelta(days=days)
-        results = db.query(TimeseriesData).filter(
-            and_(TimeseriesData.source_id == source.source_id, TimeseriesData.timestamp >= cutoff)
-        ).order_by(TimeseriesData.timestamp).all()
+        arrays = copy_to_arrays(
+            db,
+            """
+            SELECT timestamp, open, high, low, close, volume, value
+            FROM timeseries_data
+            WHERE source_id = %(source_id)s AND timestamp >= %(cutoff)s
+            ORDER BY timestamp
+            """,
+            TimeseriesData.COPY_COLUMNS,
+            {'source_id': source.source_id, 'cutoff': cutoff}
+        )
 
-        data = []
-        for row in results:
-            ts_ms = int(row.timestamp.timestamp() * 1000)
-            if row.open is not None:
-                data.append([ts_ms, float(row.open), float(row.high), float(row.low), float(row.close), float(row.volume) if row.volume else 0.0])
-            elif row.value is not None:
-                data.append([ts_ms, float(row.value)])
+        data = TimeseriesData.rows_from_arrays(arrays)
         return data
     finally:
         db.close()
@@ -11,8 +11,11 @@ CRITICAL POLICY: NO MOCK VALUES OR ESTIMATES
 - This ensures data integrity and prevents misleading visualizations
 """
 
+import numpy as np
 from datetime import datetime, timezone, timedelta
 
+MS_PER_DAY = 86_400_000
+
 def standardize_to_daily_utc(raw_data):
     """
     Takes raw data and standardizes timestamps to UTC daily boundaries.
@@ -28,10 +31,15 @@ def standardize_to_daily_utc(raw_data):
         raw_data (list): A list of lists, where each inner list is either:
                          [unix_millisecond_timestamp, value] OR
                          [unix_millisecond_timestamp, open, high, low, close, volume]
+                         An (N, 2) or (N, 6) NumPy array is also accepted and
+                         processed column-wise.
     
     Returns:
         list: A standardized list with same structure as input.
     """
+    if isinstance(raw_data, np.ndarray):
+        return _standardize_array(raw_data)
+
     if not raw_data:
         return []
     
@@ -142,6 +150,48 @@ def standardize_to_daily_utc(raw_data):
 
     return standardized_data
 
+def _standardize_array(raw_data):
+    """
+    Column-wise standardize_to_daily_utc for an (N, 2) or (N, 6) numeric array.
+    Same rules as the list path: the first record of each UTC day wins (even
+    if it is then rejected), OHLCV rows with high < low are dropped.
+    """
+    if raw_data.size == 0:
+        return []
+
+    if raw_data.ndim != 2 or raw_data.shape[1] not in (2, 6):
+        print(f"Warning: Unsupported data structure with shape {raw_data.shape}")
+        return []
+
+    data_structure = raw_data.shape[1]
+    print(f"Detected data structure: {data_structure} elements per record")
+
+    rows = raw_data.astype(np.float64, copy=False)
+    rows = rows[np.isfinite(rows[:, 0])]
+
+    # Handle both millisecond and second timestamps, then floor to UTC midnight
+    ms_timestamps = np.where(rows[:, 0] > 1000000000000, rows[:, 0], rows[:, 0] * 1000)
+    days = np.floor(ms_timestamps / MS_PER_DAY).astype(np.int64) * MS_PER_DAY
+
+    # First record per day, in chronological order
+    days, first = np.unique(days, return_index=True)
+    rows = rows[first]
+
+    if data_structure == 6:
+        # Validate OHLCV logic (high >= low)
+        valid = ~(rows[:, 2] < rows[:, 3])
+        if not valid.all():
+            print(f"Warning: Dropped {int((~valid).sum())} invalid OHLCV rows (high < low)")
+            days, rows = days[valid], rows[valid]
+
+    standardized_data = [[day] + values for day, values in zip(days.tolist(), rows[:, 1:].tolist())]
+
+    # Create continuous daily index with NaN for missing data (NO MOCK VALUES)
+    if len(standardized_data) > 1:
+        return create_continuous_index_with_nan(standardized_data, data_structure)
+
+    return standardized_data
+
 def create_continuous_index_with_nan(data, data_structure):
     """
     Create a continuous daily index with NaN values for missing days.
@@ -0,0 +1,62 @@
+"""
+Tests for the ATR indicator (src/data/atr.py)
+"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data import atr
+
+MS_PER_DAY = 86_400_000
+PERIOD = 14
+GAP_INDEX = 25
+
+
+def _ohlcv(n=40, gap_index=None):
+    rows = []
+    for i in range(n):
+        close = 100.0 + (i % 5) * 2.0 - (i % 3)
+        rows.append([i * MS_PER_DAY, close, close + 1.5 + (i % 4), close - 1.0 - (i % 2), close, 10.0])
+    if gap_index is not None:
+        rows[gap_index] = [gap_index * MS_PER_DAY] + [float('nan')] * 5
+    return rows
+
+
+def _reference_atr(rows, period):
+    """Per-bar loop: True Range, SMA seed, then Wilder's smoothing."""
+    true_range = [
+        max(rows[i][2] - rows[i][3], abs(rows[i][2] - rows[i - 1][4]), abs(rows[i][3] - rows[i - 1][4]))
+        for i in range(1, len(rows))
+    ]
+    smooth = sum(true_range[:period]) / period
+    values = [smooth]
+    for tr in true_range[period:]:
+        smooth = (smooth * (period - 1) + tr) / period
+        values.append(smooth)
+    return values
+
+
+def test_atr_matches_reference_and_drops_only_warmup():
+    rows = _ohlcv()
+    result = atr.calculate_atr_from_ohlcv(rows, PERIOD)
+
+    assert [ts for ts, _ in result] == [row[0] for row in rows[PERIOD:]]
+    for (_, value), expected in zip(result, _reference_atr(rows, PERIOD)):
+        assert math.isclose(value, expected, rel_tol=1e-9)
+
+
+def test_atr_keeps_rows_after_a_gap():
+    rows = _ohlcv(gap_index=GAP_INDEX)
+    result = atr.calculate_atr_from_ohlcv(rows, PERIOD)
+
+    # Timeline stays aligned with the price rows; gap bars carry NaN
+    assert [ts for ts, _ in result] == [row[0] for row in rows[PERIOD:]]
+    assert all(not math.isnan(value) for _, value in result[:GAP_INDEX - PERIOD])
+    assert math.isnan(result[GAP_INDEX - PERIOD][1])
+
+    values = atr.calculate_atr([r[2] for r in rows], [r[3] for r in rows], [r[4] for r in rows], PERIOD)
+    assert values[:PERIOD] == [None] * PERIOD
+    assert math.isnan(values[GAP_INDEX])
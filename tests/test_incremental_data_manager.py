@@ -0,0 +1,52 @@
+"""
+Round-trip tests for the historical dataset store (src/data/incremental_data_manager.py)
+"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data import incremental_data_manager, rsi
+
+MS_PER_DAY = 86_400_000
+GAP_INDEX = 20
+
+
+def _ohlcv_with_gap():
+    """30 daily OHLCV rows with one NaN gap day, as create_continuous_index_with_nan emits."""
+    rows = []
+    for i in range(30):
+        close = 100.0 + (i % 7) * 1.5 - (i % 3)
+        rows.append([i * MS_PER_DAY, close, close + 1.0, close - 1.0, close, 10.0])
+    rows[GAP_INDEX] = [GAP_INDEX * MS_PER_DAY] + [float('nan')] * 5
+    return rows
+
+
+def test_nan_gap_survives_save_load_and_rsi(tmp_path, monkeypatch):
+    monkeypatch.setattr(incremental_data_manager, 'HISTORICAL_DATA_DIR', str(tmp_path))
+    rows = _ohlcv_with_gap()
+
+    incremental_data_manager.save_historical_data('gold_price', rows)
+    cached = incremental_data_manager.load_historical_data('gold_price')
+
+    # Force a parse of the file, as after a restart
+    incremental_data_manager._HISTORY_CACHE.clear()
+    loaded = incremental_data_manager.load_historical_data('gold_price')
+
+    assert math.isnan(loaded[GAP_INDEX][4])
+    assert repr(cached) == repr(loaded)
+
+    result = rsi.calculate_rsi_from_ohlcv(loaded)
+    assert len(result) == len(rsi.calculate_rsi_from_ohlcv(rows))
+
+
+def test_loaded_rows_do_not_alias_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(incremental_data_manager, 'HISTORICAL_DATA_DIR', str(tmp_path))
+    incremental_data_manager.save_historical_data('btc_price', [[0, 1.0], [MS_PER_DAY, 2.0]])
+
+    first = incremental_data_manager.load_historical_data('btc_price')
+    first[0][1] = 99.0
+
+    assert incremental_data_manager.load_historical_data('btc_price')[0] == [0, 1.0]